@@ -8,6 +8,7 @@ import os
 import posixpath
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from html.parser import HTMLParser
@@ -36,11 +37,45 @@ def _sha256_bytes(data: bytes) -> str:
 
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+# Local artifact digests, keyed by absolute path and reused while stat is unchanged.
+LOCAL_HASH_CACHE_FILENAME = "local_sha256.json"
+
+
+def _local_sha256(path: Path, hash_cache: dict[str, Any] | None) -> tuple[str, int]:
+    """Return ``(sha256, bytes)`` for a local artifact, reusing ``hash_cache`` entries.
+
+    An entry is reused only while the file's ``st_mtime_ns`` and ``st_size`` match,
+    so an unchanged run costs one ``stat`` per artifact instead of a full read.
+    """
+
+    st = path.stat()
+    if hash_cache is None:
+        return _sha256_file(path), st.st_size
+    key = os.path.abspath(path)
+    cached = hash_cache.get(key)
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtime_ns") == st.st_mtime_ns
+        and cached.get("bytes") == st.st_size
+    ):
+        return str(cached["sha256"]), st.st_size
+    sha256 = _sha256_file(path)
+    hash_cache[key] = {"mtime_ns": st.st_mtime_ns, "bytes": st.st_size, "sha256": sha256}
+    return sha256, st.st_size
+
+
+def _load_local_hash_cache(path: Path) -> dict[str, Any]:
+    if not path.is_file():
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
 
 
 def _write_json(path: Path, payload: dict[str, Any]) -> None:
@@ -102,6 +137,26 @@ def _fetch_with_cache(url: str, cache_dir: Path) -> tuple[Path, dict[str, Any]]:
     return data_path, meta
 
 
+# Published artifacts are fetched concurrently; each request is dominated by network RTT.
+FETCH_CONCURRENCY = 8
+
+
+def _fetch_many_with_cache(urls: list[str], cache_dir: Path) -> dict[str, tuple[Path, dict[str, Any]]]:
+    """Fetch several URLs through `_fetch_with_cache`, overlapping the round-trips.
+
+    Duplicate URLs are fetched once (they share a cache entry). The first error
+    raised by any fetch propagates to the caller, as with sequential fetching.
+    """
+
+    unique = list(dict.fromkeys(urls))
+    if len(unique) <= 1:
+        return {url: _fetch_with_cache(url, cache_dir) for url in unique}
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=min(FETCH_CONCURRENCY, len(unique))) as pool:
+        results = pool.map(lambda url: _fetch_with_cache(url, cache_dir), unique)
+        return dict(zip(unique, results))
+
+
 class DeclaredArtifactsParser(HTMLParser):
     def __init__(self) -> None:
         super().__init__()
@@ -140,13 +195,18 @@ class DeclaredArtifactsParser(HTMLParser):
             self._h2_text += data
 
 
-def _parse_generated_utc(html: str) -> str:
-    patterns = [
+_GENERATED_UTC_PATTERNS = tuple(
+    re.compile(pattern, flags=re.IGNORECASE | re.DOTALL)
+    for pattern in (
         r"Generated \(UTC\).*?<code>([^<]+)</code>",
         r"Generated \(UTC\).*?<td>([^<]+)</td>",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, html, flags=re.IGNORECASE | re.DOTALL)
+    )
+)
+
+
+def _parse_generated_utc(html: str) -> str:
+    for pattern in _GENERATED_UTC_PATTERNS:
+        match = pattern.search(html)
         if match:
             return match.group(1).strip()
     raise RuntimeError("Generated (UTC) timestamp not found in report.html")
@@ -200,11 +260,14 @@ def _build_published_manifest(
     hrefs = _parse_declared_artifacts(html)
     entries = _artifact_entries_from_urls(report_url, hrefs)
 
+    fetched = _fetch_many_with_cache(
+        [entry.url for entry in entries if entry.url is not None], cache_dir
+    )
     artifacts: list[ArtifactEntry] = []
     for entry in entries:
         if entry.url is None:
             continue
-        artifact_path, meta = _fetch_with_cache(entry.url, cache_dir)
+        _, meta = fetched[entry.url]
         artifacts.append(
             ArtifactEntry(
                 relative_path=entry.relative_path,
@@ -240,6 +303,7 @@ def _build_local_manifest(
     local_root: Path,
     declared: list[ArtifactEntry],
     generated_utc: str,
+    hash_cache: dict[str, Any] | None = None,
 ) -> tuple[dict[str, Any], list[ArtifactEntry]]:
     artifacts: list[ArtifactEntry] = []
     for entry in declared:
@@ -256,13 +320,13 @@ def _build_local_manifest(
                 )
             )
             continue
-        sha256 = _sha256_file(local_path)
+        sha256, size_bytes = _local_sha256(local_path, hash_cache)
         artifacts.append(
             ArtifactEntry(
                 relative_path=rel,
                 url=None,
                 sha256=sha256,
-                bytes=local_path.stat().st_size,
+                bytes=size_bytes,
             )
         )
 
@@ -443,6 +507,11 @@ def run(argv: list[str] | None = None) -> int:
     parser.add_argument("--instructions-file", default="docs/baselines/dte_gpt_instructions.txt")
     parser.add_argument("--out-dir", default="out/dte_update")
     parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument(
+        "--strict-hash",
+        action="store_true",
+        help="Re-hash every local artifact instead of reusing digests cached in --cache-dir.",
+    )
 
     args = parser.parse_args(argv)
 
@@ -458,6 +527,9 @@ def run(argv: list[str] | None = None) -> int:
         return 2
     instructions_sha256 = _sha256_file(instructions_path)
 
+    hash_cache_path = cache_dir / LOCAL_HASH_CACHE_FILENAME
+    hash_cache = None if args.strict_hash else _load_local_hash_cache(hash_cache_path)
+
     retrieved_utc = _utcnow()
     try:
         published_manifest, published_entries, generated_utc = _build_published_manifest(
@@ -469,11 +541,14 @@ def run(argv: list[str] | None = None) -> int:
             local_root=local_root,
             declared=published_entries,
             generated_utc=generated_utc,
+            hash_cache=hash_cache,
         )
     except (RuntimeError, HTTPError, URLError, OSError, ValueError) as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
         return 2
 
+    if hash_cache is not None:
+        _write_json(hash_cache_path, hash_cache)
     _write_json(out_dir / "published_manifest.json", published_manifest)
     _write_json(out_dir / "local_manifest.json", local_manifest)
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import Counter
 from dataclasses import dataclass
+import os
 from pathlib import Path
 import re
 from typing import Any, Iterable, Mapping
@@ -159,6 +160,12 @@ def _filter_tiles_by_bbox(
     return filtered or paths
 
 
+# Warp settings for the in-memory window reprojection (nearest resampling, so the
+# output does not depend on the thread count).
+_WARP_NUM_THREADS = os.cpu_count() or 1
+_WARP_MEM_LIMIT_MB = 512
+
+
 def _reproject_to_projected(
     *,
     tree_values: np.ndarray,
@@ -207,6 +214,8 @@ def _reproject_to_projected(
             dst_transform=dst_transform,
             dst_crs=target,
             resampling=Resampling.nearest,
+            num_threads=_WARP_NUM_THREADS,
+            warp_mem_limit=_WARP_MEM_LIMIT_MB,
         )
         reproject(
             source=loss_values,
@@ -216,6 +225,8 @@ def _reproject_to_projected(
             dst_transform=dst_transform,
             dst_crs=target,
             resampling=Resampling.nearest,
+            num_threads=_WARP_NUM_THREADS,
+            warp_mem_limit=_WARP_MEM_LIMIT_MB,
         )
         reproject(
             source=valid_mask.astype(np.uint8),
@@ -225,6 +236,8 @@ def _reproject_to_projected(
             dst_transform=dst_transform,
             dst_crs=target,
             resampling=Resampling.nearest,
+            num_threads=_WARP_NUM_THREADS,
+            warp_mem_limit=_WARP_MEM_LIMIT_MB,
         )
 
         return dst_tree, dst_loss, dst_valid.astype(bool), dst_transform, target
@@ -170,9 +170,10 @@ class WfsMaaAmetProvider(MaaAmetProvider):
         except TypeError:
             response = urllib.request.urlopen(url)  # noqa: S310
         with response as resp:
-            payload = resp.read().decode("utf-8")
+            # Parse straight from the response bytes (json detects UTF-8) instead of
+            # holding a decoded copy of the whole payload alongside the parsed features.
+            data = json.load(resp)
         print("Maa-amet WFS response received.", flush=True)
-        data = json.loads(payload)
         return _analyze_parcels_from_geojson(data, aoi_geom)
 
 
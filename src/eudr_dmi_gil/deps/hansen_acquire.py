@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import json
 import os
 import re
+import threading
 import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
 from eudr_dmi_gil.io import data_plane
 from eudr_dmi_gil.reports.determinism import sha256_file, write_json
 
 DATASET_VERSION_DEFAULT = "2024-v1.12"
 HANSEN_BASE_DIR_NAME = "hansen_gfc_2024_v1_12"
 HANSEN_URL_TEMPLATE_ENV = "EUDR_DMI_HANSEN_URL_TEMPLATE"
+TILE_HASH_CACHE_FILENAME = "hansen_tile_sha256.json"
 DEFAULT_HANSEN_URL_TEMPLATE = (
     "https://storage.googleapis.com/earthenginepartners-hansen/"
     "GFC-2024-v1.12/Hansen_GFC-2024-v1.12_{layer}_{url_tile_id}.tif"
@@ -39,6 +48,57 @@ def resolve_tile_dir(tile_id: str) -> Path:
     return hansen_default_base_dir() / "tiles" / tile_id
 
 
+def tile_hash_cache_path() -> Path:
+    return data_plane.cache_root() / TILE_HASH_CACHE_FILENAME
+
+
+def _read_tile_hash_cache(cache_path: Path) -> dict[str, dict[str, object]]:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def sha256_tile_cached(path: Path) -> str:
+    """SHA-256 of a Hansen tile, memoized on disk across runs.
+
+    Tiles are multi-GB and effectively immutable, yet every AOI run used to re-hash
+    them. Entries in `<data_root>/cache/hansen_tile_sha256.json` are keyed by absolute
+    path and only reused while the file's mtime_ns and size still match. Concurrent
+    runs serialize their read-modify-write on a sidecar lock file.
+    """
+
+    abspath = os.path.abspath(path)
+    st = os.stat(abspath)
+    cache_path = tile_hash_cache_path()
+
+    cached = _read_tile_hash_cache(cache_path).get(abspath)
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtime_ns") == st.st_mtime_ns
+        and cached.get("size_bytes") == st.st_size
+        and isinstance(cached.get("sha256"), str)
+    ):
+        return cached["sha256"]
+
+    digest = sha256_file(Path(abspath), size_bytes=st.st_size)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path.with_name(cache_path.name + ".lock"), "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        cache = _read_tile_hash_cache(cache_path)
+        cache = {k: v for k, v in cache.items() if os.path.exists(k)}
+        cache[abspath] = {"mtime_ns": st.st_mtime_ns, "size_bytes": st.st_size, "sha256": digest}
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp_path.write_text(json.dumps(cache, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    return digest
+
+
 def _format_url(template: str, *, tile_id: str, layer: str) -> str:
     url_tile_id = tile_id
     m = re.fullmatch(r"([NS])(\d{2})_([EW])(\d{3})", tile_id)
@@ -122,9 +182,9 @@ def ensure_hansen_layers_present(
 ) -> list[HansenLayerEntry]:
     entries: list[HansenLayerEntry] = []
     url_template = resolve_hansen_url_template()
+    tile_dir = resolve_tile_dir(tile_id)
 
     for layer in layers:
-        tile_dir = resolve_tile_dir(tile_id)
         local_path = tile_dir / f"{layer}.tif"
         source_url = _format_url(url_template, tile_id=tile_id, layer=layer) if url_template else ""
 
@@ -134,7 +194,7 @@ def ensure_hansen_layers_present(
                     tile_id=tile_id,
                     layer=layer,
                     local_path=str(local_path.resolve()),
-                    sha256=sha256_file(local_path),
+                    sha256=sha256_tile_cached(local_path),
                     size_bytes=local_path.stat().st_size,
                     source_url=source_url,
                     status="present",
@@ -162,7 +222,7 @@ def ensure_hansen_layers_present(
                 tile_id=tile_id,
                 layer=layer,
                 local_path=str(local_path.resolve()),
-                sha256=sha256_file(local_path),
+                sha256=sha256_tile_cached(local_path),
                 size_bytes=local_path.stat().st_size,
                 source_url=source_url,
                 status="downloaded",
@@ -227,9 +287,7 @@ def write_tiles_manifest(
 ) -> None:
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
     created_utc = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-    ordered_entries = sorted(
-        entries, key=lambda e: (e.tile_id, e.layer, e.local_path)
-    )
+    ordered_entries = sorted(entries, key=attrgetter("tile_id", "layer", "local_path"))
     payload = {
         "dataset_version": dataset_version,
         "tile_source": tile_source,
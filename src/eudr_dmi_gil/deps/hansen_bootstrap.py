@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Iterable
 
 from eudr_dmi_gil.io import data_plane
-from eudr_dmi_gil.reports.determinism import sha256_file, write_json
+from eudr_dmi_gil.reports.determinism import write_json
 
 from .hansen_acquire import (
     DATASET_VERSION_DEFAULT,
@@ -16,6 +16,7 @@ from .hansen_acquire import (
     ensure_hansen_layers_present,
     hansen_default_base_dir,
     resolve_tile_dir,
+    sha256_tile_cached,
 )
 from . import minio_cache
 
@@ -84,7 +85,7 @@ def _entry_from_local(tile_id: str, layer: str, local_path: Path, *, status: str
         tile_id=tile_id,
         layer=layer,
         local_path=str(local_path.resolve()),
-        sha256=sha256_file(local_path),
+        sha256=sha256_tile_cached(local_path),
         size_bytes=local_path.stat().st_size,
         source_url=source_url,
         status=status,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import math
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
@@ -29,7 +30,22 @@ def _iter_coords(obj: object) -> Iterable[tuple[float, float]]:
 
 
 def load_aoi_bbox(aoi_geojson_path: Path) -> tuple[float, float, float, float]:
-    data = json.loads(aoi_geojson_path.read_text(encoding="utf-8"))
+    """Bounding box of an AOI GeoJSON, parsed once per file version.
+
+    Report runs derive the bbox for several consumers (tile selection, the Hansen
+    bootstrap, the report itself); the cache is keyed on the resolved path plus
+    mtime/size so an edited AOI is re-read.
+    """
+
+    st = aoi_geojson_path.stat()
+    return _load_aoi_bbox_cached(str(aoi_geojson_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _load_aoi_bbox_cached(
+    aoi_path: str, mtime_ns: int, size_bytes: int
+) -> tuple[float, float, float, float]:
+    data = json.loads(Path(aoi_path).read_text(encoding="utf-8"))
     coords = list(_iter_coords(data))
     if not coords:
         raise ValueError("AOI GeoJSON contains no coordinates")
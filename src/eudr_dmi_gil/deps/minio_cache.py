@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 import mimetypes
 import os
 from pathlib import Path
@@ -8,15 +7,15 @@ from pathlib import Path
 from minio import Minio
 from minio.error import S3Error
 
+from eudr_dmi_gil.reports.determinism import sha256_file
+
 _METADATA_SHA256_KEY = "x-amz-meta-sha256"
 
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    # Always hash the bytes: integrity checks must catch in-place corruption that
+    # keeps mtime and size, and uploads are not limited to tiles.
+    return sha256_file(path)
 
 
 def _parse_endpoint(raw: str) -> tuple[str, bool | None]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -9,6 +10,26 @@ from rasterio.crs import CRS
 from rasterio.features import rasterize
 
 
+@lru_cache(maxsize=32)
+def _geodesic_row_areas_m2(a: float, c: float, e: float, f: float, height: int) -> np.ndarray:
+    """Geodesic WGS84 pixel area per row of a north-up lat/lon grid (read-only).
+
+    Memoized on the grid geometry: repeated runs over the same tile windows, and
+    per-parcel passes over one tile, reuse the pyproj results.
+    """
+
+    geod = Geod(ellps="WGS84")
+    row_area_m2 = np.empty(height, dtype=np.float64)
+    x0, x1 = c, a + c
+    for row in range(height):
+        y0 = e * row + f
+        y1 = e * (row + 1) + f
+        pixel_area, _ = geod.polygon_area_perimeter([x0, x1, x1, x0], [y0, y0, y1, y1])
+        row_area_m2[row] = abs(pixel_area)
+    row_area_m2.setflags(write=False)
+    return row_area_m2
+
+
 def pixel_area_m2_raster(transform: Any, height: int, width: int, crs: Any) -> np.ndarray:
     """Return per-pixel area in square meters for a raster.
 
@@ -20,7 +41,8 @@ def pixel_area_m2_raster(transform: Any, height: int, width: int, crs: Any) -> n
 
     Notes:
       - If `crs` is EPSG:4326, compute geodesic WGS84 pixel area using
-        pyproj.Geod polygon areas for each pixel footprint.
+        pyproj.Geod polygon areas for each pixel footprint. On a north-up grid all
+        pixels in a row share one footprint area, so it is computed once per row.
       - Otherwise, treat pixels as projected and use constant area from affine scale.
     """
 
@@ -35,6 +57,11 @@ def pixel_area_m2_raster(transform: Any, height: int, width: int, crs: Any) -> n
 
     if epsg == 4326:
         geod = Geod(ellps="WGS84")
+        a, b, c, d, e, f = (float(v) for v in tuple(transform)[:6])
+        if b == 0.0 and d == 0.0:
+            row_area_m2 = _geodesic_row_areas_m2(a, c, e, f, height)
+            return np.repeat(row_area_m2[:, np.newaxis], width, axis=1)
+
         area_m2 = np.zeros((height, width), dtype=np.float64)
         for row in range(height):
             for col in range(width):
@@ -6,7 +6,7 @@ from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
-from .determinism import canonical_json_bytes
+from .determinism import HashCache, canonical_json_bytes, sha256_files_cached
 
 
 EVIDENCE_ROOT_ENV = "EUDR_DMI_EVIDENCE_ROOT"
@@ -58,19 +58,33 @@ def compute_sha256(path: str | Path, *, chunk_size: int = 1024 * 1024) -> str:
     return h.hexdigest()
 
 
-def _content_type_for_path(path: Path) -> str | None:
-    suffix = path.suffix.lower()
-    if suffix == ".json":
-        return "application/json"
-    if suffix == ".geojson":
-        return "application/geo+json"
-    if suffix == ".csv":
-        return "text/csv"
-    if suffix == ".html":
-        return "text/html"
-    if suffix == ".wkt":
-        return "text/plain"
-    return None
+_CONTENT_TYPES_BY_SUFFIX = {
+    ".json": "application/json",
+    ".geojson": "application/geo+json",
+    ".csv": "text/csv",
+    ".html": "text/html",
+    ".wkt": "text/plain",
+}
+
+
+def content_type_for_path(path: Path) -> str | None:
+    """Return the manifest `content_type` for an artifact path, or None if unmapped."""
+
+    return _CONTENT_TYPES_BY_SUFFIX.get(path.suffix.lower())
+
+
+def bundle_relpath(bundle_dir: Path, path: Path) -> str:
+    """Return ``path`` relative to ``bundle_dir`` as a POSIX string.
+
+    Artifacts are normally built as bundle_dir / ..., so slice the prefix off the
+    POSIX form instead of walking parts with Path.relative_to for each one.
+    """
+
+    prefix = bundle_dir.as_posix().rstrip("/") + "/"
+    posix = path.as_posix()
+    if posix.startswith(prefix):
+        return posix[len(prefix):]
+    return path.relative_to(bundle_dir).as_posix()
 
 
 def bundle_dir(
@@ -94,33 +108,33 @@ def bundle_dir(
     return root / bundle_date / bundle_id
 
 
-def write_manifest(bundle_dir: str | Path, artifacts: Iterable[str | Path]) -> bytes:
+def write_manifest(
+    bundle_dir: str | Path,
+    artifacts: Iterable[str | Path],
+    *,
+    hash_cache: HashCache | None = None,
+) -> bytes:
     """Write `manifest.json` in bundle_dir and return the bytes written.
 
     - stable ordering (sorted by relpath)
     - stable JSON formatting
 
     `artifacts` should be a list of files inside `bundle_dir` (or paths that can
-    be made relative to it).
+    be made relative to it). Pass the bundle run's ``hash_cache`` to reuse digests
+    already computed for unchanged artifacts.
     """
 
     bdir = Path(bundle_dir)
     records: list[ArtifactRecord] = []
     content_types: dict[str, str] = {}
 
-    for artifact in artifacts:
-        p = Path(artifact)
-        relpath = str(p.relative_to(bdir))
-        content_type = _content_type_for_path(p)
+    digests = sha256_files_cached((Path(artifact) for artifact in artifacts), hash_cache)
+    for p, (sha256, size_bytes) in digests.items():
+        relpath = bundle_relpath(bdir, p)
+        content_type = content_type_for_path(p)
         if content_type:
             content_types[relpath] = content_type
-        records.append(
-            ArtifactRecord(
-                relpath=relpath,
-                sha256=compute_sha256(p),
-                size_bytes=p.stat().st_size,
-            )
-        )
+        records.append(ArtifactRecord(relpath=relpath, sha256=sha256, size_bytes=size_bytes))
 
     records_sorted = sorted(records, key=lambda r: r.relpath)
 
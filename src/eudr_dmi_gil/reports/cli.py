@@ -6,18 +6,29 @@ import re
 import sys
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import csv
-
 from .bundle import bundle_dir as compute_bundle_dir
-from .bundle import compute_sha256
-from .bundle import resolve_evidence_root, write_manifest
-from .determinism import canonical_json_bytes, sha256_bytes, write_bytes, write_json
+from .bundle import (
+    bundle_relpath,
+    content_type_for_path,
+    resolve_evidence_root,
+    write_manifest,
+)
+from .determinism import (
+    HashCache,
+    canonical_json_bytes,
+    sha256_bytes,
+    sha256_file_cached,
+    sha256_files_cached,
+    write_bytes,
+    write_json,
+)
 from eudr_dmi_gil.deps.hansen_acquire import build_entries_from_provenance, infer_hansen_latest_year
 from eudr_dmi_gil.deps.hansen_tiles import load_aoi_bbox
 from eudr_dmi_gil.geo.aoi_area import compute_aoi_geodesic_area_ha
@@ -95,26 +106,29 @@ def _parcel_reference_sort_key(parcel: object) -> tuple[float, float, str]:
     return (-float(forest_area), -float(tie_area), parcel_id)
 
 
+# Evidence artifact roles keyed by file name (see _artifact_role in main()).
+_ARTIFACT_ROLES_BY_NAME = {
+    "forest_loss_post_2020_mask.geojson": "forest_loss_mask",
+    "forest_current_tree_cover_mask.geojson": "forest_current_mask",
+    "forest_2000_tree_cover_mask.geojson": "forest_2000_mask",
+    "forest_end_year_tree_cover_mask.geojson": "forest_end_year_mask",
+    "forest_loss_post_2020_tiles.json": "hansen_tiles_manifest",
+    "forest_loss_post_2020_summary.json": "forest_loss_summary",
+    "forest_mask_debug.json": "forest_mask_debug",
+    "maaamet_forest_area_crosscheck.csv": "maaamet_crosscheck_csv",
+    "maaamet_forest_area_crosscheck_summary.json": "maaamet_crosscheck_summary",
+    "maaamet_top10_parcels.geojson": "maaamet_top10_geojson",
+    "maaamet_top10_parcels.csv": "maaamet_top10_csv",
+    "maaamet_fields_inventory.json": "maaamet_fields_inventory",
+    "maaamet_parcels_metadata.json": "maaamet_parcels_metadata",
+}
+
+
 def _rel_href(from_path: Path, to_path: Path) -> str:
     rel = os.path.relpath(to_path, start=from_path.parent)
     return Path(rel).as_posix()
 
 
-def _content_type_for_path(path: Path) -> str | None:
-    suffix = path.suffix.lower()
-    if suffix == ".json":
-        return "application/json"
-    if suffix == ".geojson":
-        return "application/geo+json"
-    if suffix == ".csv":
-        return "text/csv"
-    if suffix == ".html":
-        return "text/html"
-    if suffix == ".wkt":
-        return "text/plain"
-    return None
-
-
 def _parcel_table_rows(parcels: list[object]) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     for parcel in parcels:
@@ -730,6 +744,15 @@ def main(argv: list[str] | None = None) -> int:
     bdir = compute_bundle_dir(bundle_id=bundle_id, bundle_date=bundle_date)
     resolve_evidence_root()
 
+    def _bundle_relpath(p: Path) -> str:
+        return bundle_relpath(bdir, p)
+
+    # Digests are reused across this bundle run only; nothing leaks into later runs.
+    hash_cache: HashCache = {}
+
+    def _artifact_sha256(p: Path) -> str:
+        return sha256_file_cached(p, hash_cache)[0]
+
     # Write geometry into the bundle for portability.
     inputs_dir = bdir / "inputs"
     inputs_dir.mkdir(parents=True, exist_ok=True)
@@ -892,7 +915,7 @@ def main(argv: list[str] | None = None) -> int:
             hansen_stats_parcels = maaamet_parcels
             if args.hansen_parcel_top_n > 0:
                 eligible_for_topn = [
-                    p for p in maaamet_parcels if (getattr(p, "forest_area_ha", None) or 0.0) >= 3.0
+                    p for p in maaamet_parcels if (p.forest_area_ha or 0.0) >= 3.0
                 ]
                 ranked_for_topn = sorted(eligible_for_topn, key=_parcel_reference_sort_key)
                 hansen_stats_parcels = ranked_for_topn[: args.hansen_parcel_top_n]
@@ -1028,6 +1051,7 @@ def main(argv: list[str] | None = None) -> int:
                 else "fail"
             )
 
+        forest_metrics = hansen_analysis.raw.forest_metrics
         metric_rows.extend(
             [
                 MetricRow(
@@ -1053,42 +1077,42 @@ def main(argv: list[str] | None = None) -> int:
                 ),
                 MetricRow(
                     variable="rfm_area_ha",
-                    value=hansen_analysis.raw.forest_metrics.rfm_area_ha,
+                    value=forest_metrics.rfm_area_ha,
                     unit="ha",
                     source="hansen_gfc",
                     notes="rfm_mask",
                 ),
                 MetricRow(
                     variable="loss_total_ha",
-                    value=hansen_analysis.raw.forest_metrics.loss_total_ha,
+                    value=forest_metrics.loss_total_ha,
                     unit="ha",
                     source="hansen_gfc",
                     notes="rfm_mask & (lossyear > 0)",
                 ),
                 MetricRow(
                     variable="loss_2021_2024_ha",
-                    value=hansen_analysis.raw.forest_metrics.loss_2021_2024_ha,
+                    value=forest_metrics.loss_2021_2024_ha,
                     unit="ha",
                     source="hansen_gfc",
-                    notes=f"rfm_mask & (lossyear in 21..{hansen_analysis.raw.forest_metrics.end_year - 2000})",
+                    notes=f"rfm_mask & (lossyear in 21..{forest_metrics.end_year - 2000})",
                 ),
                 MetricRow(
                     variable="forest_2024_ha",
-                    value=hansen_analysis.raw.forest_metrics.forest_2024_ha,
+                    value=forest_metrics.forest_2024_ha,
                     unit="ha",
                     source="hansen_gfc",
                     notes="rfm_mask & (lossyear == 0)",
                 ),
                 MetricRow(
                     variable="forest_end_year_ha",
-                    value=hansen_analysis.raw.forest_metrics.forest_end_year_ha,
+                    value=forest_metrics.forest_end_year_ha,
                     unit="ha",
                     source="hansen_gfc",
                     notes="forest_mask_end_year",
                 ),
                 MetricRow(
                     variable="end_year",
-                    value=hansen_analysis.raw.forest_metrics.end_year,
+                    value=forest_metrics.end_year,
                     unit="year",
                     source="hansen_gfc",
                     notes="forest_end_year",
@@ -1141,21 +1165,15 @@ def main(argv: list[str] | None = None) -> int:
                 "pixel_initial_tree_cover_ha": hansen_result.initial_tree_cover_ha,
                 "pixel_forest_loss_post_2020_ha": hansen_result.forest_loss_post_2020_ha,
                 "pixel_current_tree_cover_ha": hansen_result.current_tree_cover_ha,
-                "mask_forest_loss_post_2020": str(
-                    hansen_result.mask_forest_loss_post_2020_path.relative_to(bdir)
-                ).replace("\\", "/"),
-                "mask_forest_current_year": str(
-                    hansen_result.mask_forest_current_path.relative_to(bdir)
-                ).replace("\\", "/"),
-                "mask_forest_2000": str(
-                    hansen_result.mask_forest_2000_path.relative_to(bdir)
-                ).replace("\\", "/"),
-                "mask_forest_end_year": str(
-                    hansen_result.mask_forest_end_year_path.relative_to(bdir)
-                ).replace("\\", "/"),
-                "tiles_manifest": str(
-                    hansen_analysis.tiles_manifest_path.relative_to(bdir)
-                ).replace("\\", "/"),
+                "mask_forest_loss_post_2020": _bundle_relpath(
+                    hansen_result.mask_forest_loss_post_2020_path
+                ),
+                "mask_forest_current_year": _bundle_relpath(
+                    hansen_result.mask_forest_current_path
+                ),
+                "mask_forest_2000": _bundle_relpath(hansen_result.mask_forest_2000_path),
+                "mask_forest_end_year": _bundle_relpath(hansen_result.mask_forest_end_year_path),
+                "tiles_manifest": _bundle_relpath(hansen_analysis.tiles_manifest_path),
             }
         }
 
@@ -1164,31 +1182,23 @@ def main(argv: list[str] | None = None) -> int:
                 "area_ha": hansen_analysis.computed.area_ha,
                 "pixel_size_m": hansen_analysis.computed.pixel_size_m,
                 "mask_geojson_ref": {
-                    "relpath": str(hansen_analysis.loss_mask_path.relative_to(bdir)).replace(
-                        "\\", "/"
-                    ),
-                    "sha256": compute_sha256(hansen_analysis.loss_mask_path),
+                    "relpath": _bundle_relpath(hansen_analysis.loss_mask_path),
+                    "sha256": _artifact_sha256(hansen_analysis.loss_mask_path),
                     "content_type": "application/geo+json",
                 },
                 "mask_forest_2000_ref": {
-                    "relpath": str(hansen_analysis.forest_2000_mask_path.relative_to(bdir)).replace(
-                        "\\", "/"
-                    ),
-                    "sha256": compute_sha256(hansen_analysis.forest_2000_mask_path),
+                    "relpath": _bundle_relpath(hansen_analysis.forest_2000_mask_path),
+                    "sha256": _artifact_sha256(hansen_analysis.forest_2000_mask_path),
                     "content_type": "application/geo+json",
                 },
                 "mask_forest_end_year_ref": {
-                    "relpath": str(
-                        hansen_analysis.forest_end_year_mask_path.relative_to(bdir)
-                    ).replace("\\", "/"),
-                    "sha256": compute_sha256(hansen_analysis.forest_end_year_mask_path),
+                    "relpath": _bundle_relpath(hansen_analysis.forest_end_year_mask_path),
+                    "sha256": _artifact_sha256(hansen_analysis.forest_end_year_mask_path),
                     "content_type": "application/geo+json",
                 },
                 "tiles_manifest_ref": {
-                    "relpath": str(hansen_analysis.tiles_manifest_path.relative_to(bdir)).replace(
-                        "\\", "/"
-                    ),
-                    "sha256": compute_sha256(hansen_analysis.tiles_manifest_path),
+                    "relpath": _bundle_relpath(hansen_analysis.tiles_manifest_path),
+                    "sha256": _artifact_sha256(hansen_analysis.tiles_manifest_path),
                     "content_type": "application/json",
                 },
             }
@@ -1237,11 +1247,10 @@ def main(argv: list[str] | None = None) -> int:
         )
 
         tiles_manifest_ref = {
-            "relpath": str(hansen_analysis.tiles_manifest_path.relative_to(bdir)).replace("\\", "/"),
-            "sha256": compute_sha256(hansen_analysis.tiles_manifest_path),
+            "relpath": _bundle_relpath(hansen_analysis.tiles_manifest_path),
+            "sha256": _artifact_sha256(hansen_analysis.tiles_manifest_path),
         }
 
-        forest_metrics = hansen_analysis.raw.forest_metrics
         forest_metrics_params = hansen_analysis.raw.forest_metrics_params
         forest_metrics_debug = hansen_analysis.raw.forest_metrics_debug
         tile_refs_treecover = [item for item in tiles_used if item.get("layer") == "treecover2000"]
@@ -1323,10 +1332,8 @@ def main(argv: list[str] | None = None) -> int:
                 "tile_source": hansen_config.tile_source,
                 "aoi_geojson_sha256": geo_sha,
                 "tiles_manifest": {
-                    "relpath": str(hansen_analysis.tiles_manifest_path.relative_to(bdir)).replace(
-                        "\\", "/"
-                    ),
-                    "sha256": compute_sha256(hansen_analysis.tiles_manifest_path),
+                    "relpath": _bundle_relpath(hansen_analysis.tiles_manifest_path),
+                    "sha256": _artifact_sha256(hansen_analysis.tiles_manifest_path),
                 },
                 "tiles_used": tiles_used,
             }
@@ -1364,6 +1371,11 @@ def main(argv: list[str] | None = None) -> int:
             "git_commit": _git_commit(),
         },
     }
+    method_area = (
+        hansen_analysis.raw.forest_metrics_params.method_area
+        if hansen_analysis is not None
+        else "unknown"
+    )
     if hansen_result is not None:
         cutoff_code = max(hansen_config.cutoff_year - 2000, 0)
         first_post_cutoff_year = hansen_config.cutoff_year + 1
@@ -1371,16 +1383,8 @@ def main(argv: list[str] | None = None) -> int:
             "canopy_threshold_percent": hansen_config.canopy_threshold_percent,
             "cutoff_year": hansen_config.cutoff_year,
             "acceptance_threshold_ha": forest_loss_threshold_ha,
-            "pixel_area_method": (
-                hansen_analysis.raw.forest_metrics_params.method_area
-                if hansen_analysis is not None
-                else "unknown"
-            ),
-            "area_method": (
-                hansen_analysis.raw.forest_metrics_params.method_area
-                if hansen_analysis is not None
-                else "unknown"
-            ),
+            "pixel_area_method": method_area,
+            "area_method": method_area,
             "lossyear_mapping": (
                 "0=no_loss; 1..end_year_code=2001..end_year "
                 "(year=lossyear+2000)"
@@ -1417,11 +1421,7 @@ def main(argv: list[str] | None = None) -> int:
             "threshold_ha": forest_loss_threshold_ha,
             "status": forest_loss_status,
             "uncertainty": {
-                "pixel_area_method": (
-                    hansen_analysis.raw.forest_metrics_params.method_area
-                    if hansen_analysis is not None
-                    else "unknown"
-                ),
+                "pixel_area_method": method_area,
                 "nodata": "masked_as_no_loss",
                 "projection": "EPSG:4326",
                 "conservative_bounds": "area estimates are lower-bound for masked/no-data pixels",
@@ -1447,8 +1447,8 @@ def main(argv: list[str] | None = None) -> int:
                     "computed.forest_loss_post_2020.pixel_forest_loss_post_2020_ha",
                 ],
                 "artifact_relpaths": [
-                    str(hansen_analysis.loss_mask_path.relative_to(bdir)).replace("\\", "/"),
-                    str(hansen_analysis.tiles_manifest_path.relative_to(bdir)).replace("\\", "/"),
+                    _bundle_relpath(hansen_analysis.loss_mask_path),
+                    _bundle_relpath(hansen_analysis.tiles_manifest_path),
                 ],
                 "status": forest_loss_status,
             }
@@ -1541,16 +1541,7 @@ def main(argv: list[str] | None = None) -> int:
         ],
         "policy_mapping_refs": policy_mapping_refs,
         "extensions": {
-            "metrics_rows_v1": [
-                {
-                    "variable": r.variable,
-                    "value": r.value,
-                    "unit": r.unit,
-                    "source": r.source,
-                    "notes": r.notes,
-                }
-                for r in metric_rows
-            ]
+            "metrics_rows_v1": [asdict(r) for r in metric_rows]
         },
     }
 
@@ -1587,10 +1578,8 @@ def main(argv: list[str] | None = None) -> int:
             )
         if maaamet_parcels_metadata_path is not None:
             maaamet_block["parcels_metadata_ref"] = {
-                "relpath": str(maaamet_parcels_metadata_path.relative_to(bdir)).replace(
-                    "\\", "/"
-                ),
-                "sha256": compute_sha256(maaamet_parcels_metadata_path),
+                "relpath": _bundle_relpath(maaamet_parcels_metadata_path),
+                "sha256": _artifact_sha256(maaamet_parcels_metadata_path),
                 "content_type": "application/json",
             }
 
@@ -1664,10 +1653,8 @@ def main(argv: list[str] | None = None) -> int:
                     "tile_source": hansen_config.tile_source,
                     "aoi_geojson_sha256": geo_sha,
                     "tiles_manifest": {
-                        "relpath": str(hansen_analysis.tiles_manifest_path.relative_to(bdir)).replace(
-                            "\\", "/"
-                        ),
-                        "sha256": compute_sha256(hansen_analysis.tiles_manifest_path),
+                        "relpath": _bundle_relpath(hansen_analysis.tiles_manifest_path),
+                        "sha256": _artifact_sha256(hansen_analysis.tiles_manifest_path),
                     },
                     "tiles_used": fallback_tiles_used,
                 }
@@ -1739,13 +1726,13 @@ def main(argv: list[str] | None = None) -> int:
                 "diff_pct": maaamet_result.diff_pct,
             },
             "csv_ref": {
-                "relpath": str(maaamet_result.csv_path.relative_to(bdir)).replace("\\", "/"),
-                "sha256": compute_sha256(maaamet_result.csv_path),
+                "relpath": _bundle_relpath(maaamet_result.csv_path),
+                "sha256": _artifact_sha256(maaamet_result.csv_path),
                 "content_type": "text/csv",
             },
             "summary_ref": {
-                "relpath": str(maaamet_result.summary_path.relative_to(bdir)).replace("\\", "/"),
-                "sha256": compute_sha256(maaamet_result.summary_path),
+                "relpath": _bundle_relpath(maaamet_result.summary_path),
+                "sha256": _artifact_sha256(maaamet_result.summary_path),
                 "content_type": "application/json",
             },
         }
@@ -1793,7 +1780,7 @@ def main(argv: list[str] | None = None) -> int:
                 latest_year=hansen_result.forest_metrics.end_year,
                 layers=layers,
             )
-        map_config_relpath = str(map_config_path.relative_to(bdir)).replace("\\", "/")
+        map_config_relpath = _bundle_relpath(map_config_path)
         map_config_href = _rel_href(report_html_path, map_config_path)
         report["map_assets"] = {
             "config_relpath": map_config_relpath,
@@ -1808,78 +1795,78 @@ def main(argv: list[str] | None = None) -> int:
         }
         artifact_paths.append(map_config_path)
 
+    pre_evidence_bytes: bytes | None = None
+    report_json_digest: tuple[str, int] | None = None
     if args.out_format in ("json", "both"):
-        with _timed("write_report_json"):
-            report_json_path.parent.mkdir(parents=True, exist_ok=True)
-            report_json_bytes = canonical_json_bytes(report) + b"\n"
-            report_json_path.write_bytes(report_json_bytes)
+        with _timed("hash_report_json"):
+            # The evidence index records the report as it stands before evidence_artifacts
+            # is populated. Hash those bytes in memory; the file is written once, below.
+            pre_evidence_bytes = canonical_json_bytes(report) + b"\n"
+            report_json_digest = (sha256_bytes(pre_evidence_bytes), len(pre_evidence_bytes))
             artifact_paths.append(report_json_path)
 
-    # HTML output
-    if args.out_format in ("html", "both"):
-        with _timed("write_report_html"):
-            report_html_path.parent.mkdir(parents=True, exist_ok=True)
-            # Link to whatever artifacts are already known; report JSON is included if produced.
-            known_artifacts_for_html = list(artifact_paths)
-            html = _render_html_summary(
-                report,
-                html_path=report_html_path,
-                artifact_paths=known_artifacts_for_html,
-                map_config_relpath=map_config_href,
-                parcel_rows=parcel_rows,
-            )
-            report_html_path.write_text(html, encoding="utf-8")
-            artifact_paths.append(report_html_path)
+    # Every artifact on disk so far is final: hash them in the background (hashlib releases
+    # the GIL) while the HTML renders, so the evidence loop below mostly hits the cache.
+    with ThreadPoolExecutor(max_workers=1) as prehash_pool:
+        prehash = prehash_pool.submit(
+            sha256_files_cached,
+            [p for p in artifact_paths if p != report_json_path],
+            hash_cache,
+        )
+
+        # HTML output
+        if args.out_format in ("html", "both"):
+            with _timed("write_report_html"):
+                report_html_path.parent.mkdir(parents=True, exist_ok=True)
+                # Link to whatever artifacts are already known; report JSON is included if
+                # produced.
+                known_artifacts_for_html = list(artifact_paths)
+                html = _render_html_summary(
+                    report,
+                    html_path=report_html_path,
+                    artifact_paths=known_artifacts_for_html,
+                    map_config_relpath=map_config_href,
+                    parcel_rows=parcel_rows,
+                )
+                report_html_path.write_text(html, encoding="utf-8")
+                artifact_paths.append(report_html_path)
+
+        prehash.result()
 
     def _artifact_role(relpath: str) -> str | None:
         if relpath == geo_rel.as_posix():
             return "aoi_geometry"
-        if relpath.endswith(f"/{aoi_id}.json"):
-            return "report_json"
-        if relpath.endswith(f"/{aoi_id}.html"):
-            return "report_html"
-        if relpath.endswith("/metrics.csv"):
-            return "metrics_csv"
-        if relpath.endswith("forest_loss_post_2020_mask.geojson"):
-            return "forest_loss_mask"
-        if relpath.endswith("forest_current_tree_cover_mask.geojson"):
-            return "forest_current_mask"
-        if relpath.endswith("forest_2000_tree_cover_mask.geojson"):
-            return "forest_2000_mask"
-        if relpath.endswith("forest_end_year_tree_cover_mask.geojson"):
-            return "forest_end_year_mask"
-        if relpath.endswith("forest_loss_post_2020_tiles.json"):
-            return "hansen_tiles_manifest"
-        if relpath.endswith("forest_loss_post_2020_summary.json"):
-            return "forest_loss_summary"
-        if relpath.endswith("forest_mask_debug.json"):
-            return "forest_mask_debug"
-        if relpath.endswith("map/map_config.json"):
-            return "report_map_config"
-        if relpath.endswith("maaamet_forest_area_crosscheck.csv"):
-            return "maaamet_crosscheck_csv"
-        if relpath.endswith("maaamet_forest_area_crosscheck_summary.json"):
-            return "maaamet_crosscheck_summary"
-        if relpath.endswith("maaamet_top10_parcels.geojson"):
-            return "maaamet_top10_geojson"
-        if relpath.endswith("maaamet_top10_parcels.csv"):
-            return "maaamet_top10_csv"
-        if relpath.endswith("maaamet_fields_inventory.json"):
-            return "maaamet_fields_inventory"
-        if relpath.endswith("maaamet_parcels_metadata.json"):
-            return "maaamet_parcels_metadata"
-        return None
+        parent, _, name = relpath.rpartition("/")
+        if parent:
+            if name == f"{aoi_id}.json":
+                return "report_json"
+            if name == f"{aoi_id}.html":
+                return "report_html"
+            if name == "metrics.csv":
+                return "metrics_csv"
+            if name == "map_config.json" and parent.rpartition("/")[2] == "map":
+                return "report_map_config"
+        return _ARTIFACT_ROLES_BY_NAME.get(name)
 
     # Populate evidence_artifacts in report JSON (exclude manifest to avoid circularity).
     report["evidence_artifacts"] = []
-    for p in sorted(set(artifact_paths), key=lambda p: p.as_posix()):
-        relpath = str(p.relative_to(bdir)).replace("\\\\", "/")
+    # One canonical, de-duplicated ordering shared by evidence_artifacts and the manifest.
+    artifacts_by_posix = {p.as_posix(): p for p in artifact_paths}
+    ordered_artifact_paths = [artifacts_by_posix[k] for k in sorted(artifacts_by_posix)]
+    artifact_digests = sha256_files_cached(
+        (p for p in ordered_artifact_paths if p != report_json_path), hash_cache
+    )
+    if report_json_digest is not None:
+        artifact_digests[report_json_path] = report_json_digest
+    for p in ordered_artifact_paths:
+        sha256, size_bytes = artifact_digests[p]
+        relpath = _bundle_relpath(p)
         entry = {
             "relpath": relpath,
-            "sha256": compute_sha256(p),
-            "size_bytes": p.stat().st_size,
+            "sha256": sha256,
+            "size_bytes": size_bytes,
         }
-        content_type = _content_type_for_path(p)
+        content_type = content_type_for_path(p)
         if content_type:
             entry["content_type"] = content_type
         role = _artifact_role(relpath)
@@ -1887,10 +1874,25 @@ def main(argv: list[str] | None = None) -> int:
             entry["meta"] = {"role": role}
         report["evidence_artifacts"].append(entry)
 
-    # If we wrote report JSON, rewrite it now that evidence_artifacts is populated.
-    if args.out_format in ("json", "both"):
-        with _timed("rewrite_report_json"):
-            report_json_path.write_bytes(canonical_json_bytes(report) + b"\n")
+    # Write report JSON now that evidence_artifacts is populated.
+    if pre_evidence_bytes is not None:
+        with _timed("write_report_json"):
+            # Only evidence_artifacts changed since the pre-evidence serialization, so
+            # splice the serialized list in rather than re-encoding the whole report.
+            marker = b'"evidence_artifacts":[]'
+            if pre_evidence_bytes.count(marker) == 1:
+                report_json_bytes = pre_evidence_bytes.replace(
+                    marker,
+                    b'"evidence_artifacts":' + canonical_json_bytes(report["evidence_artifacts"]),
+                )
+            else:
+                report_json_bytes = canonical_json_bytes(report) + b"\n"
+            # A rerun that reproduces the report leaves the file (and its cached digest)
+            # alone; any other on-disk content, including a damaged file, is replaced.
+            if not (
+                report_json_path.is_file() and report_json_path.read_bytes() == report_json_bytes
+            ):
+                write_bytes(report_json_path, report_json_bytes)
 
     # Validate contract.
     from .validate import validate_aoi_report
@@ -1901,13 +1903,13 @@ def main(argv: list[str] | None = None) -> int:
     # Manifest written by bundle writer.
     # Exclude manifest itself from artifacts passed to the writer.
     with _timed("write_manifest"):
-        write_manifest(bdir, sorted(set(artifact_paths), key=lambda p: p.as_posix()))
+        write_manifest(bdir, ordered_artifact_paths, hash_cache=hash_cache)
 
     print(str(bdir))
     return 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricRow:
     variable: str
     value: int | float
@@ -1931,21 +1933,16 @@ def _parse_metric_rows(raw_metrics: list[str], *, fallback_dummy: str | None) ->
     return sorted(rows, key=lambda r: r.variable)
 
 
-def _parse_metric_row(raw: str) -> MetricRow:
-    # variable=value:unit[:source[:notes]]
-    if "=" not in raw or ":" not in raw:
-        raise ValueError("--metric must be variable=value:unit[:source[:notes]]")
+# variable=value:unit[:source[:notes]]; notes keep any further colons.
+_METRIC_ROW_RE = re.compile(r"([^=]*)=([^:]*):([^:]*)(?::([^:]*)(?::(.*))?)?", re.DOTALL)
 
-    variable, rest = raw.split("=", 1)
-    parts = rest.split(":")
-    if len(parts) < 2:
-        raise ValueError("--metric must be variable=value:unit[:source[:notes]]")
 
-    value_str = parts[0]
-    unit = parts[1]
-    source = parts[2] if len(parts) >= 3 else ""
-    notes = ":".join(parts[3:]) if len(parts) >= 4 else ""
+def _parse_metric_row(raw: str) -> MetricRow:
+    match = _METRIC_ROW_RE.fullmatch(raw)
+    if match is None:
+        raise ValueError("--metric must be variable=value:unit[:source[:notes]]")
 
+    variable, value_str, unit, source, notes = match.groups(default="")
     variable = variable.strip()
     unit = unit.strip()
     source = source.strip()
@@ -2001,17 +1998,28 @@ def _metrics_from_rows(rows: list[MetricRow]) -> dict[str, dict[str, Any]]:
     return out
 
 
-def _write_metrics_csv(path: Path, rows: list[MetricRow]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
+
+
+def _csv_field(value: str) -> str:
+    # Same output as csv.writer with QUOTE_MINIMAL for the values we emit.
+    if _CSV_SPECIAL_CHARS.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
 
-    # Ensure stable row ordering.
-    ordered = sorted(rows, key=lambda r: r.variable)
 
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["variable", "value", "unit", "source", "notes"])
-        for r in ordered:
-            writer.writerow([r.variable, _stable_value_str(r.value), r.unit, r.source, r.notes])
+def _write_metrics_csv(path: Path, rows: list[MetricRow]) -> None:
+    # Rows arrive sorted by variable (see _parse_metric_rows and main()).
+    lines = ["variable,value,unit,source,notes\r\n"]
+    for r in rows:
+        lines.append(
+            ",".join(
+                _csv_field(field)
+                for field in (r.variable, _stable_value_str(r.value), r.unit, r.source, r.notes)
+            )
+            + "\r\n"
+        )
+    write_bytes(path, "".join(lines).encode("utf-8"))
 
 
 def _stable_value_str(value: int | float) -> str:
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import os
+import shutil
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from zipfile import ZIP_DEFLATED, ZipInfo, ZipFile
 
@@ -31,12 +37,71 @@ def sha256_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
+# Files above this size (Hansen tiles, large masks) are hashed through mmap.
+MMAP_HASH_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+
+def sha256_file(path: Path, *, size_bytes: int | None = None) -> str:
+    """Return the SHA-256 hex digest of a file.
+
+    Pass ``size_bytes`` when the caller has already stat'ed the file to skip the
+    extra fstat used to choose between mmap and buffered hashing.
+    """
+
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        if size_bytes is None:
+            size_bytes = os.fstat(f.fileno()).st_size
+        if size_bytes > MMAP_HASH_THRESHOLD_BYTES:
+            # Feed the mapped pages straight to the C hasher: no per-chunk copies.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mm).hexdigest()
+        # hashlib.file_digest reads into a C-side buffer and hashes with the GIL released.
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# Absolute path -> (st_mtime_ns, st_size, sha256); one per bundle run, owned by the caller.
+HashCache = dict[str, tuple[int, int, str]]
+
+
+def sha256_file_cached(path: Path, cache: HashCache | None = None) -> tuple[str, int]:
+    """Return ``(sha256, size_bytes)`` for a file, hashing each file version once per cache.
+
+    Each call costs a single ``stat``: entries are keyed by absolute path (no
+    symlink resolution) and reused only while ``st_mtime_ns`` and ``st_size`` are
+    unchanged. Callers scope ``cache`` to one bundle run; without it the file is
+    simply hashed.
+    """
+
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], st.st_size
+    digest = sha256_file(path, size_bytes=st.st_size)
+    if cache is not None:
+        cache[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest, st.st_size
+
+
+def sha256_files_cached(
+    paths: Iterable[Path], cache: HashCache | None = None
+) -> dict[Path, tuple[str, int]]:
+    """Hash several files concurrently via `sha256_file_cached`.
+
+    SHA-256 over file objects releases the GIL, so a small thread pool overlaps
+    disk reads and hashing across artifacts. The returned mapping preserves the
+    input order.
+    """
+
+    ordered = list(paths)
+    if len(ordered) <= 1:
+        return {p: sha256_file_cached(p, cache) for p in ordered}
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1, len(ordered))) as pool:
+        return dict(zip(ordered, pool.map(partial(sha256_file_cached, cache=cache), ordered)))
 
 
 def write_bytes(path: Path, data: bytes) -> None:
@@ -48,9 +113,13 @@ def write_json(path: Path, obj: object) -> None:
     write_bytes(path, canonical_json_bytes(obj) + b"\n")
 
 
-def create_deterministic_zip(zip_path: Path, files: dict[str, bytes]) -> None:
+def create_deterministic_zip(zip_path: Path, files: Mapping[str, bytes | Path]) -> None:
     """Create a deterministic zip (stable ordering + stable timestamps).
 
+    Values may be in-memory bytes or paths to files on disk; paths are streamed
+    into the archive so large bundles are never held in memory at once. Both
+    forms produce identical archive bytes for identical content.
+
     Note: determinism can still be affected by zip metadata and compression
     implementation differences across Python versions; this function minimizes
     variation in practice by controlling ordering and timestamps.
@@ -66,7 +135,13 @@ def create_deterministic_zip(zip_path: Path, files: dict[str, bytes]) -> None:
             info = ZipInfo(relpath)
             info.date_time = EPOCH_ZIP_DT
             info.compress_type = ZIP_DEFLATED
-            zf.writestr(info, content)
+            if isinstance(content, Path):
+                # Mirror writestr(): declare the size up front, then stream the body.
+                info.file_size = content.stat().st_size
+                with content.open("rb") as src, zf.open(info, mode="w") as dest:
+                    shutil.copyfileobj(src, dest, 1024 * 1024)
+            else:
+                zf.writestr(info, content)
 
 
 def file_size_bytes(path: Path) -> int:
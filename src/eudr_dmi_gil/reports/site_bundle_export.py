@@ -133,12 +133,12 @@ def export_site_bundle_reports(
     index_path.write_text(_render_index_html(entries_sorted), encoding="utf-8")
 
     prefix = "site_bundle_reports/"
-    files: dict[str, bytes] = {}
+    files: dict[str, bytes | Path] = {}
     for p in sorted(paths.out_dir.rglob("*"), key=lambda x: x.as_posix()):
         if p.is_dir():
             continue
         rel = p.relative_to(paths.out_dir).as_posix()
-        files[prefix + rel] = p.read_bytes()
+        files[prefix + rel] = p
 
     create_deterministic_zip(paths.zip_path, files)
 
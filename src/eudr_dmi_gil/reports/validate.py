@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -8,7 +9,11 @@ import jsonschema
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import ValidationError
 
+# FormatChecker holds no per-document state, so one instance serves every validator.
+_FORMAT_CHECKER = jsonschema.FormatChecker()
 
+
+@cache
 def _find_repo_root(start: Path) -> Path:
     current = start
     for _ in range(10):
@@ -34,7 +39,20 @@ def _schema_path_for_version(report_version: str) -> Path:
 
 def load_schema(schema_path: str | Path | None = None) -> dict[str, Any]:
     path = Path(schema_path) if schema_path is not None else _default_schema_path()
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(path.read_bytes())
+
+
+@lru_cache(maxsize=4)
+def _validator_for(schema_path: Path) -> Draft202012Validator:
+    """Build the Draft 2020-12 validator for a schema file once per process."""
+
+    schema = load_schema(schema_path)
+    return Draft202012Validator(schema, format_checker=_FORMAT_CHECKER)
+
+
+def _as_dict(report: Mapping[str, Any]) -> dict[str, Any]:
+    # The schema "object" type only matches real dicts; copy other Mappings once, up front.
+    return report if isinstance(report, dict) else dict(report)
 
 
 def validate_aoi_report_v1(
@@ -48,12 +66,12 @@ def validate_aoi_report_v1(
       jsonschema.exceptions.ValidationError if invalid.
     """
 
-    schema = load_schema(schema_path)
-    validator = Draft202012Validator(schema, format_checker=jsonschema.FormatChecker())
-    validator.validate(dict(report))
+    path = Path(schema_path).resolve() if schema_path is not None else _default_schema_path()
+    report = _as_dict(report)
+    _validator_for(path).validate(report)
 
-    _validate_traceability(dict(report))
-    _validate_hansen_methodology(dict(report))
+    _validate_traceability(report)
+    _validate_hansen_methodology(report)
 
 
 def validate_aoi_report(
@@ -63,17 +81,16 @@ def validate_aoi_report(
 ) -> None:
     report_version = str(report.get("report_version", "aoi_report_v1"))
     resolved_schema = (
-        Path(schema_path)
+        Path(schema_path).resolve()
         if schema_path is not None
         else _schema_path_for_version(report_version)
     )
-    schema = load_schema(resolved_schema)
-    validator = Draft202012Validator(schema, format_checker=jsonschema.FormatChecker())
-    validator.validate(dict(report))
+    report = _as_dict(report)
+    _validator_for(resolved_schema).validate(report)
 
-    _validate_traceability(dict(report))
-    _validate_hansen_methodology(dict(report))
-    _validate_policy_mapping(dict(report))
+    _validate_traceability(report)
+    _validate_hansen_methodology(report)
+    _validate_policy_mapping(report)
 
 
 def _validate_traceability(report: Mapping[str, Any]) -> None:
@@ -118,7 +135,7 @@ def _validate_traceability(report: Mapping[str, Any]) -> None:
         if isinstance(result_ref, str):
             referenced_results.add(result_ref)
 
-    orphaned_results = sorted(r for r in results if r not in referenced_results)
+    orphaned_results = sorted(results - referenced_results)
     if orphaned_results:
         raise ValidationError(f"Orphaned results without traceability: {orphaned_results}")
 
@@ -174,9 +191,10 @@ def _validate_hansen_methodology(report: Mapping[str, Any]) -> None:
     if not isinstance(metrics, dict):
         return
 
-    result_refs_forest_loss = _results_reference_forest_loss(report)
-
-    if "pixel_forest_loss_post_2020_ha" not in metrics and not result_refs_forest_loss:
+    # The metric alone triggers the checks; only scan results when it is absent.
+    if "pixel_forest_loss_post_2020_ha" not in metrics and not _results_reference_forest_loss(
+        report
+    ):
         return
 
     computed = report.get("computed")
@@ -208,9 +226,10 @@ def _validate_hansen_methodology(report: Mapping[str, Any]) -> None:
     if not isinstance(forest_outputs, Mapping):
         raise ValidationError("computed_outputs.forest_loss_post_2020 must be present")
 
-    _ensure_evidence_refs(report, forest_outputs)
-    _ensure_external_dependency_refs(report)
-    _ensure_validation_refs(report)
+    relpaths = _collect_evidence_relpaths(report)
+    _ensure_evidence_refs(forest_outputs, relpaths)
+    _ensure_external_dependency_refs(report, relpaths)
+    _ensure_validation_refs(report, relpaths)
 
 
 def _results_reference_forest_loss(report: Mapping[str, Any]) -> bool:
@@ -235,9 +254,7 @@ def _collect_evidence_relpaths(report: Mapping[str, Any]) -> set[str]:
     return relpaths
 
 
-def _ensure_evidence_refs(report: Mapping[str, Any], forest_outputs: Mapping[str, Any]) -> None:
-    relpaths = _collect_evidence_relpaths(report)
-
+def _ensure_evidence_refs(forest_outputs: Mapping[str, Any], relpaths: set[str]) -> None:
     mask_ref = forest_outputs.get("mask_geojson_ref")
     if isinstance(mask_ref, Mapping):
         relpath = mask_ref.get("relpath")
@@ -251,12 +268,11 @@ def _ensure_evidence_refs(report: Mapping[str, Any], forest_outputs: Mapping[str
             raise ValidationError(f"Missing evidence_artifacts relpath: {relpath}")
 
 
-def _ensure_external_dependency_refs(report: Mapping[str, Any]) -> None:
+def _ensure_external_dependency_refs(report: Mapping[str, Any], relpaths: set[str]) -> None:
     deps = report.get("external_dependencies")
     if not isinstance(deps, list) or not deps:
         raise ValidationError("external_dependencies must be present when Hansen outputs are included")
 
-    relpaths = _collect_evidence_relpaths(report)
     has_hansen = False
     for dep in deps:
         if not isinstance(dep, Mapping):
@@ -284,8 +300,7 @@ def _ensure_external_dependency_refs(report: Mapping[str, Any]) -> None:
         raise ValidationError("external_dependencies must include hansen_gfc_2024_v1_12")
 
 
-def _ensure_validation_refs(report: Mapping[str, Any]) -> None:
-    relpaths = _collect_evidence_relpaths(report)
+def _ensure_validation_refs(report: Mapping[str, Any], relpaths: set[str]) -> None:
     validation = report.get("validation")
     if not isinstance(validation, Mapping):
         return
@@ -330,7 +345,7 @@ def validate_aoi_report_v1_file(
 ) -> dict[str, Any]:
     """Load and validate a report JSON file; returns the parsed JSON."""
 
-    obj = json.loads(Path(json_path).read_text(encoding="utf-8"))
+    obj = json.loads(Path(json_path).read_bytes())
     validate_aoi_report_v1(obj, schema_path=schema_path)
     return obj
 
@@ -340,6 +355,6 @@ def validate_aoi_report_file(
     *,
     schema_path: str | Path | None = None,
 ) -> dict[str, Any]:
-    obj = json.loads(Path(json_path).read_text(encoding="utf-8"))
+    obj = json.loads(Path(json_path).read_bytes())
     validate_aoi_report(obj, schema_path=schema_path)
     return obj
@@ -3,22 +3,36 @@ from __future__ import annotations
 import json
 import logging
 import os
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from functools import cache, lru_cache, partial
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import rasterio
-from rasterio.crs import CRS
+import shapely
 from pyproj import Geod
-from rasterio.enums import Resampling
+from rasterio.crs import CRS
+from rasterio.enums import MaskFlags, Resampling
 from rasterio.errors import RasterioIOError
-from rasterio.mask import mask as rio_mask
+from rasterio.features import bounds as feature_bounds
+from rasterio.mask import raster_geometry_mask
 from rasterio.transform import array_bounds
 from rasterio.warp import calculate_default_transform, reproject, transform_geom
+from rasterio.windows import Window
 from shapely.geometry import mapping, shape
 from shapely.ops import unary_union
 
+try:  # Optional speed-up
+    from numba import njit  # type: ignore[import-not-found]
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 from eudr_dmi_gil.deps.hansen_acquire import (
     DATASET_VERSION_DEFAULT,
     HansenLayerEntry,
@@ -26,22 +40,16 @@ from eudr_dmi_gil.deps.hansen_acquire import (
     hansen_default_base_dir,
     infer_hansen_latest_year,
     resolve_hansen_url_template,
+    sha256_tile_cached,
 )
 from eudr_dmi_gil.deps.hansen_bootstrap import ensure_hansen_for_aoi
 from eudr_dmi_gil.deps.hansen_tiles import hansen_tile_ids_for_bbox, load_aoi_bbox
 from eudr_dmi_gil.geo.forest_area_core import (
-    forest_2024_mask,
-    forest_mask_end_year,
-    loss_2021_2024_mask,
-    loss_mask_range,
-    loss_total_mask,
     pixel_area_m2_raster,
     rasterize_zone_mask,
     rfm_mask,
-    zonal_area_ha,
 )
-from eudr_dmi_gil.reports.determinism import sha256_file, write_json
-
+from eudr_dmi_gil.reports.determinism import canonical_json_bytes, write_bytes, write_json
 
 LOGGER = logging.getLogger(__name__)
 
@@ -143,22 +151,37 @@ class TileSource:
 class LocalTileSource(TileSource):
     def __init__(self, tile_dir: Path) -> None:
         self._tile_dir = tile_dir
+        self._tifs: list[Path] | None = None
+
+    def _all_tifs(self) -> list[Path]:
+        # The recursive fallback walk is shared by the layer lookups of one compute
+        # call (sources are created per call, so later downloads are seen next run).
+        if self._tifs is None:
+            self._tifs = list(self._tile_dir.rglob("*.tif"))
+        return self._tifs
 
     def list_layer_files(self, layer: str) -> list[Path]:
         if not self._tile_dir.exists():
             return []
 
         layer_dir = self._tile_dir / layer
-        candidates: list[Path] = []
         if layer_dir.is_dir():
-            candidates.extend(sorted(layer_dir.glob("*.tif")))
+            candidates = list(layer_dir.glob("*.tif"))
         else:
-            direct = self._tile_dir / f"{layer}.tif"
-            if direct.is_file():
-                candidates.append(direct)
-            candidates.extend(sorted(self._tile_dir.glob(f"{layer}_*.tif")))
-            candidates.extend(sorted(self._tile_dir.glob(f"{layer}-*.tif")))
-            candidates.extend(sorted(self._tile_dir.glob(f"**/{layer}.tif")))
+            # <layer>.tif at any depth, plus <layer>_*.tif / <layer>-*.tif at the top level.
+            filename = f"{layer}.tif"
+            candidates = [
+                p
+                for p in self._all_tifs()
+                if p.name == filename
+                or (
+                    p.parent == self._tile_dir
+                    and (
+                        fnmatchcase(p.name, f"{layer}_*.tif")
+                        or fnmatchcase(p.name, f"{layer}-*.tif")
+                    )
+                )
+            ]
         return sorted(set(candidates))
 
     def tile_relpath(self, path: Path) -> str:
@@ -168,13 +191,56 @@ class LocalTileSource(TileSource):
             return path.as_posix()
 
 
+def _pairs_for_tile_ids(
+    tile_dir: Path, tile_ids: list[str] | None
+) -> list[tuple[Path, Path]] | None:
+    """Pair the AOI's tiles directly from the per-tile cache layout.
+
+    The shared Hansen cache stores ``<tile_dir>/<tile_id>/<layer>.tif`` for every
+    AOI ever processed, so when the AOI's tile IDs are known only those pairs are
+    used, without walking the whole cache. Returns None (list the directory
+    instead) when IDs are unknown or any tile is missing from that layout.
+    """
+
+    if not tile_ids:
+        return None
+    pairs: list[tuple[Path, Path]] = []
+    for tile_id in sorted(set(tile_ids)):
+        tree_path = tile_dir / tile_id / "treecover2000.tif"
+        loss_path = tile_dir / tile_id / "lossyear.tif"
+        if not (tree_path.is_file() and loss_path.is_file()):
+            return None
+        pairs.append((tree_path, loss_path))
+    return pairs
+
+
+def _coverage_union(geometries: list[Any]) -> Any:
+    """Union parcels that the AOI declares (``"coverage": true``) as non-overlapping.
+
+    Coverage union only dissolves shared edges, which is far cheaper than a full
+    overlay for parcel-heavy AOIs. Falls back to `unary_union` if GEOS rejects
+    the input or the result is invalid (i.e. the parcels were not a coverage).
+    """
+
+    try:
+        merged = shapely.coverage_union_all(geometries)
+    except shapely.errors.GEOSException:
+        return unary_union(geometries)
+    if merged.is_empty or not merged.is_valid:
+        return unary_union(geometries)
+    return merged
+
+
 def _load_aoi_geometry(aoi_geojson_path: Path) -> dict[str, Any]:
     data = json.loads(aoi_geojson_path.read_text(encoding="utf-8"))
     if data.get("type") == "FeatureCollection":
         geometries = [shape(feat["geometry"]) for feat in data.get("features", [])]
         if not geometries:
             raise ValueError("AOI GeoJSON FeatureCollection has no features")
-        geom = unary_union(geometries)
+        if data.get("coverage") is True:
+            geom = _coverage_union(geometries)
+        else:
+            geom = unary_union(geometries)
         return mapping(geom)
     if data.get("type") == "Feature":
         return data["geometry"]
@@ -195,51 +261,131 @@ def _pair_tiles(treecover_tiles: list[Path], lossyear_tiles: list[Path]) -> list
 
     if len(tree_names) == len(treecover_tiles) and len(loss_names) == len(lossyear_tiles):
         lossyear_by_name = {p.name: p for p in lossyear_tiles}
-        pairs: list[tuple[Path, Path]] = []
-        for tree_path in treecover_tiles:
-            match = lossyear_by_name.get(tree_path.name)
-            if match is None:
-                raise RuntimeError(
-                    f"No matching lossyear tile for treecover2000 tile: {tree_path.name}"
-                )
-            pairs.append((tree_path, match))
-        return pairs
-
-    lossyear_by_parent = {p.parent.name: p for p in lossyear_tiles}
-    pairs = []
-    for tree_path in treecover_tiles:
-        match = lossyear_by_parent.get(tree_path.parent.name)
-        if match is None:
+        missing = [p.name for p in treecover_tiles if p.name not in lossyear_by_name]
+        if missing:
             raise RuntimeError(
-                f"No matching lossyear tile for treecover2000 tile in {tree_path.parent.name}"
+                f"No matching lossyear tile for treecover2000 tile: {', '.join(missing)}"
             )
-        pairs.append((tree_path, match))
-    return pairs
+        return [(p, lossyear_by_name[p.name]) for p in treecover_tiles]
 
+    lossyear_by_parent = {p.parent.name: p for p in lossyear_tiles}
+    missing = [
+        p.parent.name for p in treecover_tiles if p.parent.name not in lossyear_by_parent
+    ]
+    if missing:
+        raise RuntimeError(
+            f"No matching lossyear tile for treecover2000 tile in {', '.join(missing)}"
+        )
+    return [(p, lossyear_by_parent[p.parent.name]) for p in treecover_tiles]
 
-def _mask_raster(
+
+_WGS84_CRS = CRS.from_epsg(4326)
+
+
+def _geom_in_crs(geom: dict[str, Any], crs: Any) -> dict[str, Any]:
+    """A WGS84 GeoJSON geometry in ``crs``; Hansen's own EPSG:4326 grids need no transform."""
+
+    if crs == _WGS84_CRS:
+        return geom
+    return transform_geom("EPSG:4326", crs, geom)
+
+
+def _aoi_window(
     dataset: rasterio.io.DatasetReader,
     geom: dict[str, Any],
-) -> tuple[np.ma.MaskedArray, Any]:
+) -> tuple[Window | None, np.ndarray, Any]:
+    """Locate the AOI inside a tile without reading any pixels.
+
+    Returns the AOI bounding window (None when the AOI misses the tile), the
+    outside-AOI boolean mask over that window, and the window transform.
+    """
+
     geom_crs = dataset.crs
     if geom_crs is None:
         raise RuntimeError("Raster dataset has no CRS")
 
-    geom_in_crs = transform_geom("EPSG:4326", geom_crs, geom)
+    geom_in_crs = _geom_in_crs(geom, geom_crs)
     try:
-        data, transform = rio_mask(dataset, [geom_in_crs], crop=True, filled=False)
+        outside, transform, window = raster_geometry_mask(dataset, [geom_in_crs], crop=True)
     except ValueError:
-        return np.ma.masked_all((1, 1, 1)), dataset.transform
-    return data, transform
+        return None, np.ones((1, 1), dtype=bool), dataset.transform
+    return window, outside, transform
 
 
-def _extract_loss_band(dataset: rasterio.io.DatasetReader) -> np.ma.MaskedArray | None:
+def _zone_misses_grid(
+    zone_geom: dict[str, Any], transform: Any, shape: tuple[int, ...]
+) -> bool:
+    """True when the zone's bounding box lies strictly outside a north-up grid.
+
+    Lets tiles the zone never reaches skip rasterization. Touching edges and
+    rotated grids are never reported as misses, so all_touched burns are unaffected.
+    """
+
+    if transform.b != 0 or transform.d != 0:
+        return False
+    x0, y0, x1, y1 = array_bounds(shape[0], shape[1], transform)
+    west, east = min(x0, x1), max(x0, x1)
+    south, north = min(y0, y1), max(y0, y1)
+    zone_west, zone_south, zone_east, zone_north = feature_bounds(zone_geom)
+    return zone_east < west or zone_west > east or zone_north < south or zone_south > north
+
+
+def _read_aoi_band(
+    dataset: rasterio.io.DatasetReader,
+    window: Window | None,
+    outside: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Read band 1 over the AOI window only.
+
+    Returns plain arrays: the values with invalid pixels (outside the AOI or
+    nodata) set to 0, and the boolean invalid mask.
+    """
+
+    if window is None:
+        return np.zeros((1, 1), dtype=np.uint8), np.ones((1, 1), dtype=bool)
+    flags = dataset.mask_flag_enums[0]
+    nodata = dataset.nodatavals[0]
+    if np.dtype(dataset.dtypes[0]).kind in "iu" and (
+        flags == [MaskFlags.all_valid] or (flags == [MaskFlags.nodata] and nodata is not None)
+    ):
+        # Plain read: the nodata compare is all the masked read would do, without
+        # the MaskedArray wrapper and GDAL mask-band pass (Hansen layers land here).
+        values = dataset.read(1, window=window)
+        if flags == [MaskFlags.nodata]:
+            invalid = values == nodata
+            invalid |= outside
+        else:
+            invalid = outside.copy()
+    else:
+        band = dataset.read(1, window=window, masked=True)
+        invalid = np.ma.getmaskarray(band) | outside
+        values = np.ma.getdata(band)
+    values[invalid] = 0
+    return values, invalid
+
+
+def _as_uint8_if_lossless(values: np.ndarray) -> np.ndarray:
+    """Return ``values`` as uint8 when every value fits, otherwise unchanged.
+
+    Hansen layers are uint8 already (no copy); wider integer rasters holding
+    0..255 are narrowed so the threshold comparisons run on 1-byte lanes.
+    """
+
+    if values.dtype == np.uint8 or values.dtype.kind not in "iu" or values.size == 0:
+        return values
+    if int(values.min()) < 0 or int(values.max()) > 255:
+        return values
+    return values.astype(np.uint8)
+
+
+def _loss_band_index(dataset: rasterio.io.DatasetReader) -> int | None:
+    """Index of an optional binary loss band, from band descriptions only (no pixel read)."""
+
     if dataset.count <= 1:
         return None
-    descriptions = list(dataset.descriptions or [])
-    for idx, desc in enumerate(descriptions, start=1):
+    for idx, desc in enumerate(dataset.descriptions or (), start=1):
         if desc and "loss" in str(desc).lower():
-            return dataset.read(idx, masked=True)
+            return idx
     return None
 
 
@@ -266,8 +412,44 @@ def _pixel_area_ha_projected(transform: Any) -> float:
     return abs(transform.a * transform.e) / 10000.0
 
 
-def _pixel_area_ha_geographic(transform: Any, mask: np.ndarray) -> float:
-    geod = Geod(ellps="WGS84")
+_WGS84_GEOD = Geod(ellps="WGS84")
+
+
+@lru_cache(maxsize=65536)
+def _geodesic_cell_area_m2(x0: float, x1: float, y0: float, y1: float) -> float:
+    """Geodesic WGS84 area of the lon/lat cell spanning x0..x1, y0..y1.
+
+    Memoized: the loss, baseline and current masks of a tile hit the same rows.
+    """
+
+    area, _ = _WGS84_GEOD.polygon_area_perimeter([x0, x1, x1, x0], [y0, y0, y1, y1])
+    return abs(area)
+
+
+def _pixel_area_ha_geographic(
+    transform: Any, mask: np.ndarray, row_area_m2: np.ndarray | None = None
+) -> float:
+    if transform.b == 0 and transform.d == 0:
+        # North-up lat/lon grid: every pixel in a row has the same geodesic area, so
+        # evaluate one polygon per occupied row and weight it by the row's pixel count.
+        row_counts = np.count_nonzero(mask, axis=1)
+        rows = np.flatnonzero(row_counts)
+        if rows.size == 0:
+            return 0.0
+        if row_area_m2 is not None:
+            return float(np.dot(row_counts[rows], row_area_m2[rows])) / 10000.0
+        a, c, e, f = float(transform.a), float(transform.c), float(transform.e), float(transform.f)
+        x0, x1 = c, a + c
+        row_areas_m2 = np.fromiter(
+            (
+                _geodesic_cell_area_m2(x0, x1, e * row + f, e * (row + 1) + f)
+                for row in rows.tolist()
+            ),
+            dtype=np.float64,
+            count=rows.size,
+        )
+        return float(np.dot(row_counts[rows], row_areas_m2)) / 10000.0
+
     rows, cols = np.where(mask)
     if rows.size == 0:
         return 0.0
@@ -275,17 +457,43 @@ def _pixel_area_ha_geographic(transform: Any, mask: np.ndarray) -> float:
     for row, col in zip(rows.tolist(), cols.tolist()):
         x0, y0 = transform * (col, row)
         x1, y1 = transform * (col + 1, row + 1)
-        lons = [x0, x1, x1, x0]
-        lats = [y0, y0, y1, y1]
-        area, _ = geod.polygon_area_perimeter(lons, lats)
-        total_area_m2 += abs(area)
+        total_area_m2 += _geodesic_cell_area_m2(x0, x1, y0, y1)
     return total_area_m2 / 10000.0
 
 
-def _compute_area_ha(crs: Any, transform: Any, mask: np.ndarray) -> float:
+def _compute_area_ha(
+    crs: Any, transform: Any, mask: np.ndarray, row_area_m2: np.ndarray | None = None
+) -> float:
+    """Area of ``mask`` in hectares.
+
+    ``row_area_m2`` may carry precomputed geodesic row areas for a north-up
+    lat/lon grid (see `_geodesic_row_area_m2`) to skip the pyproj calls.
+    """
+
     if crs is not None and getattr(crs, "is_projected", False):
-        return float(mask.sum()) * _pixel_area_ha_projected(transform)
-    return _pixel_area_ha_geographic(transform, mask)
+        return float(np.count_nonzero(mask)) * _pixel_area_ha_projected(transform)
+    return _pixel_area_ha_geographic(transform, mask, row_area_m2)
+
+
+def _geodesic_row_area_m2(
+    crs: Any, transform: Any, pixel_area_m2: np.ndarray
+) -> np.ndarray | None:
+    """Per-row areas from `pixel_area_m2_raster`, when they are geodesic WGS84 areas.
+
+    That holds for north-up EPSG:4326 grids, where each row's value is the same
+    polygon area `_pixel_area_ha_geographic` would compute.
+    """
+
+    if (
+        crs is None
+        or getattr(crs, "is_projected", False)
+        or transform.b != 0
+        or transform.d != 0
+        or pixel_area_m2.shape[1] == 0
+        or CRS.from_user_input(crs).to_epsg() != 4326
+    ):
+        return None
+    return pixel_area_m2[:, 0]
 
 
 def _entries_from_manifest(manifest_path: Path) -> tuple[list[str] | None, list[HansenLayerEntry]]:
@@ -323,6 +531,8 @@ def _reproject_to_projected(
     src_transform: rasterio.Affine,
     src_crs: CRS,
     target_crs: str | int,
+    num_threads: int = 1,
+    warp_mem_limit_mb: int = 0,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, rasterio.Affine, object]:
     if src_crs is None:
         return tree_values, loss_values, tree_mask, loss_mask, src_transform, src_crs
@@ -347,53 +557,42 @@ def _reproject_to_projected(
         if dst_width <= 0 or dst_height <= 0:
             return None
 
-        dst_tree = np.zeros((dst_height, dst_width), dtype=tree_values.dtype)
-        dst_loss = np.zeros((dst_height, dst_width), dtype=loss_values.dtype)
-        dst_tree_mask = np.zeros((dst_height, dst_width), dtype=np.uint8)
-        dst_loss_mask = np.zeros((dst_height, dst_width), dtype=np.uint8)
-
-        reproject(
-            source=tree_values,
-            destination=dst_tree,
-            src_transform=src_transform,
-            src_crs=src_crs,
-            dst_transform=dst_transform,
-            dst_crs=target,
-            resampling=Resampling.nearest,
-        )
-        reproject(
-            source=loss_values,
-            destination=dst_loss,
-            src_transform=src_transform,
-            src_crs=src_crs,
-            dst_transform=dst_transform,
-            dst_crs=target,
-            resampling=Resampling.nearest,
-        )
+        # All layers share one grid: warp them as bands of a single stack so the
+        # pixel mapping is derived once. Nearest resampling keeps values exact. Nodata
+        # masks with no set pixel stay all-False and are not warped at all.
+        stack_dtype = np.result_type(tree_values.dtype, loss_values.dtype, np.uint8)
+        layers = [tree_values, loss_values]
+        warp_tree_mask = bool(tree_mask.any())
+        warp_loss_mask = bool(loss_mask.any())
+        if warp_tree_mask:
+            layers.append(tree_mask)
+        if warp_loss_mask:
+            layers.append(loss_mask)
+        source = np.empty((len(layers), src_height, src_width), dtype=stack_dtype)
+        for band, layer in enumerate(layers):
+            source[band] = layer
+        destination = np.zeros((len(layers), dst_height, dst_width), dtype=stack_dtype)
         reproject(
-            source=tree_mask.astype(np.uint8),
-            destination=dst_tree_mask,
-            src_transform=src_transform,
-            src_crs=src_crs,
-            dst_transform=dst_transform,
-            dst_crs=target,
-            resampling=Resampling.nearest,
-        )
-        reproject(
-            source=loss_mask.astype(np.uint8),
-            destination=dst_loss_mask,
+            source=source,
+            destination=destination,
             src_transform=src_transform,
             src_crs=src_crs,
             dst_transform=dst_transform,
             dst_crs=target,
             resampling=Resampling.nearest,
+            num_threads=num_threads,
+            warp_mem_limit=warp_mem_limit_mb,
         )
 
+        masks = iter(destination[2:])
+        no_mask = np.zeros((dst_height, dst_width), dtype=bool)
+        dst_tree_mask = next(masks) != 0 if warp_tree_mask else no_mask
+        dst_loss_mask = next(masks) != 0 if warp_loss_mask else no_mask.copy()
         return (
-            dst_tree,
-            dst_loss,
-            dst_tree_mask.astype(bool),
-            dst_loss_mask.astype(bool),
+            destination[0].astype(tree_values.dtype, copy=False),
+            destination[1].astype(loss_values.dtype, copy=False),
+            dst_tree_mask,
+            dst_loss_mask,
             dst_transform,
             target,
         )
@@ -420,45 +619,322 @@ def _reproject_to_projected(
 def _mask_features(mask: np.ndarray, transform: Any, crs: Any) -> list[dict[str, Any]]:
     from rasterio.features import shapes
 
-    shapes_iter = shapes(mask.astype(np.uint8), mask=mask, transform=transform)
-    features: list[dict[str, Any]] = []
-    for geom, value in shapes_iter:
-        if value != 1:
-            continue
-        geom_wgs84 = transform_geom(crs, "EPSG:4326", geom)
-        features.append({"type": "Feature", "properties": {}, "geometry": geom_wgs84})
-    return features
+    # Same-width reinterpretation of the bool mask: no uint8 copy per mask.
+    shapes_iter = shapes(mask.view(np.uint8), mask=mask, transform=transform)
+    geoms = [geom for geom, value in shapes_iter if value == 1]
+    if not geoms:
+        return []
+    # One batched call reuses a single coordinate transformation for every polygon.
+    geoms_wgs84 = transform_geom(crs, "EPSG:4326", geoms)
+    return [
+        {"type": "Feature", "properties": {}, "geometry": geom_wgs84}
+        for geom_wgs84 in geoms_wgs84
+    ]
+
+
+# Same output as json.dumps(..., sort_keys=True, ensure_ascii=False), without building
+# a fresh encoder for every feature.
+_GEOMETRY_SORT_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False)
 
+# A mask feature as (geometry sort key, canonical feature bytes).
+_EncodedFeature = tuple[str, bytes]
 
-def _write_mask_geojson(path: Path, features: list[dict[str, Any]]) -> None:
-    ordered = sorted(
-        features, key=lambda f: json.dumps(f.get("geometry"), sort_keys=True, ensure_ascii=False)
+
+def _encode_mask_features(features: list[dict[str, Any]]) -> list[_EncodedFeature]:
+    """Serialize features as soon as a tile produces them.
+
+    Tiles hand back compact strings instead of nested coordinate dicts, so the
+    run only buffers the bytes that end up in the GeoJSON plus their sort keys.
+    """
+
+    encode = _GEOMETRY_SORT_ENCODER.encode
+    return [(encode(f.get("geometry")), canonical_json_bytes(f)) for f in features]
+
+
+def _write_mask_geojson(path: Path, features: list[_EncodedFeature]) -> None:
+    # Stable sort on the geometry key only, so ties keep tile order as before.
+    ordered = sorted(features, key=lambda f: f[0]) if len(features) > 1 else features
+    # Byte-identical to write_json({"type": "FeatureCollection", "features": [...]}).
+    write_bytes(
+        path,
+        b'{"features":['
+        + b",".join(body for _, body in ordered)
+        + b'],"type":"FeatureCollection"}\n',
     )
-    write_json(path, {"type": "FeatureCollection", "features": ordered})
 
 
-def compute_forest_loss_post_2020(
+# Columns of the per-row pixel tallies from `_zone_row_tallies`. Every tally is
+# restricted to the zone; all but the nodata ones also to valid pixels.
+_TALLY_RFM = 0
+_TALLY_LOSS_TOTAL = 1
+_TALLY_LOSS_RECENT = 2
+_TALLY_FOREST_END = 3
+_TALLY_CURRENT = 4
+_TALLY_LOSS_POST_2020 = 5
+_TALLY_TREE_NODATA = 6
+_TALLY_LOSS_NODATA = 7
+_TALLY_ZONE_VALID = 8
+_TALLY_COUNT = 9
+
+# Lossyear code of the first year counted as recent loss (2021).
+_RECENT_LOSS_START_CODE = 2021 - 2000
+
+
+if _NUMBA_AVAILABLE:
+
+    # Serial and GIL-free: tile pairs already run on concurrent threads, so a prange
+    # kernel would only oversubscribe the cores (and start numba's thread pool).
+    @njit(nogil=True, cache=True)
+    def _zone_row_tallies_numba(
+        tree_values: np.ndarray,
+        loss_values: np.ndarray,
+        tree_nodata: np.ndarray,
+        loss_nodata: np.ndarray,
+        zone_mask: np.ndarray,
+        canopy_threshold: int,
+        cutoff_code: int,
+        recent_start_code: int,
+        end_code: int,
+    ) -> np.ndarray:
+        rows, cols = tree_values.shape
+        out = np.zeros((rows, 9), dtype=np.int64)
+        for r in range(rows):
+            for c in range(cols):
+                if not zone_mask[r, c]:
+                    continue
+                tree_nd = tree_nodata[r, c]
+                loss_nd = loss_nodata[r, c]
+                if tree_nd:
+                    out[r, 6] += 1
+                if loss_nd:
+                    out[r, 7] += 1
+                if tree_nd or loss_nd:
+                    continue
+                out[r, 8] += 1
+                if tree_values[r, c] < canopy_threshold:
+                    continue
+                loss = loss_values[r, c]
+                out[r, 0] += 1
+                if loss > 0:
+                    out[r, 1] += 1
+                    if loss >= recent_start_code and loss <= end_code:
+                        out[r, 2] += 1
+                if loss == 0:
+                    out[r, 3] += 1
+                    out[r, 4] += 1
+                elif loss > end_code:
+                    out[r, 3] += 1
+                if loss > cutoff_code:
+                    out[r, 5] += 1
+        return out
+
+
+def _zone_row_tallies(
+    tree_values: np.ndarray,
+    loss_values: np.ndarray,
+    tree_nodata: np.ndarray,
+    loss_nodata: np.ndarray,
+    zone_mask: np.ndarray,
     *,
-    aoi_geojson_path: Path,
-    output_dir: Path,
-    config: HansenConfig,
-    zone_geom_wgs84: dict[str, Any] | None = None,
-    parcel_ids: list[str] | None = None,
-) -> ForestLossResult:
-    tile_source = LocalTileSource(config.tile_dir)
+    canopy_threshold: int,
+    cutoff_code: int,
+    end_code: int,
+) -> np.ndarray:
+    """Count, per raster row, the zone pixels in each forest/loss class.
+
+    Returns an int64 array of shape (rows, _TALLY_COUNT) indexed by the
+    ``_TALLY_*`` columns. With numba this is one pass over the inputs with no
+    temporary masks; the NumPy fallback yields identical counts.
+    """
+
+    if _NUMBA_AVAILABLE:
+        return _zone_row_tallies_numba(
+            tree_values,
+            loss_values,
+            tree_nodata,
+            loss_nodata,
+            zone_mask,
+            canopy_threshold,
+            cutoff_code,
+            _RECENT_LOSS_START_CODE,
+            end_code,
+        )
 
-    treecover_tiles = tile_source.list_layer_files("treecover2000")
-    lossyear_tiles = tile_source.list_layer_files("lossyear")
-    pairs = _pair_tiles(treecover_tiles, lossyear_tiles)
+    masks = _forest_masks(
+        tree_values,
+        loss_values,
+        (~tree_nodata) & (~loss_nodata),
+        zone_mask,
+        canopy_threshold=canopy_threshold,
+        cutoff_code=cutoff_code,
+        end_code=end_code,
+    )
+    columns = (
+        masks.baseline,
+        masks.loss_total,
+        masks.loss_recent,
+        masks.forest_end,
+        masks.current_cover,
+        masks.loss_post_2020,
+        tree_nodata & zone_mask,
+        loss_nodata & zone_mask,
+        masks.zone_valid,
+    )
+    return np.stack([np.count_nonzero(m, axis=1) for m in columns], axis=1).astype(
+        np.int64, copy=False
+    )
 
-    geom = _load_aoi_geometry(aoi_geojson_path)
-    aoi_shape = shape(geom)
-    if zone_geom_wgs84 is None:
-        zone_shape = aoi_shape
-    else:
-        zone_shape = shape(zone_geom_wgs84)
-        zone_shape = zone_shape.intersection(aoi_shape)
 
+@dataclass(frozen=True)
+class _ForestMasks:
+    """Zone-restricted forest/loss masks of one tile (see `_forest_masks`)."""
+
+    zone_valid: np.ndarray
+    baseline: np.ndarray
+    loss_total: np.ndarray
+    loss_recent: np.ndarray
+    forest_end: np.ndarray
+    current_cover: np.ndarray
+    loss_post_2020: np.ndarray
+
+
+def _forest_masks(
+    tree_values: np.ndarray,
+    loss_values: np.ndarray,
+    valid: np.ndarray,
+    zone_mask: np.ndarray,
+    *,
+    canopy_threshold: int,
+    cutoff_code: int,
+    end_code: int,
+) -> _ForestMasks:
+    # Every forest mask is RFM-within-valid-and-zone narrowed by a lossyear test, so
+    # build that baseline once and derive the rest from it (same definitions as
+    # eudr_dmi_gil.geo.forest_area_core) instead of re-thresholding per mask.
+    zone_valid = zone_mask & valid
+    baseline = rfm_mask(tree_values, canopy_threshold)
+    baseline &= zone_valid
+    no_loss = loss_values == 0
+    loss_total = baseline & (loss_values > 0)
+    loss_recent = loss_total & (loss_values >= _RECENT_LOSS_START_CODE)
+    loss_recent &= loss_values <= end_code
+    forest_end = no_loss | (loss_values > end_code)
+    forest_end &= baseline
+    return _ForestMasks(
+        zone_valid=zone_valid,
+        baseline=baseline,
+        loss_total=loss_total,
+        loss_recent=loss_recent,
+        forest_end=forest_end,
+        current_cover=baseline & no_loss,
+        loss_post_2020=baseline & (loss_values > cutoff_code),
+    )
+
+
+def _tally_area_ha(tallies: np.ndarray, column: int, row_area_m2: np.ndarray) -> float:
+    """Area in hectares of a tally column given per-row pixel areas.
+
+    Matches `_pixel_area_ha_geographic`: occupied rows only, counts dotted with areas.
+    """
+
+    row_counts = tallies[:, column]
+    rows = np.flatnonzero(row_counts)
+    if rows.size == 0:
+        return 0.0
+    return float(np.dot(row_counts[rows], row_area_m2[rows])) / 10000.0
+
+
+def _masked_area_ha(mask: np.ndarray, pixel_area_m2: np.ndarray) -> float:
+    """`zonal_area_ha` for a mask that `_forest_masks` already restricted to the zone."""
+
+    return float(np.sum(pixel_area_m2[mask], dtype=np.float64)) / 10_000.0
+
+
+@dataclass(frozen=True)
+class _TilePairStats:
+    raster_shape: tuple[int, int]
+    crs: str
+    used_projected: bool
+    forest_loss_ha: float = 0.0
+    initial_cover_ha: float = 0.0
+    current_cover_ha: float = 0.0
+    current_forest_true_pixels: int = 0
+    loss_post_2020_true_pixels: int = 0
+    tree_nodata_pixels: int = 0
+    lossyear_nodata_pixels: int = 0
+    rfm_true_pixels: int = 0
+    loss_21_24_true_pixels: int = 0
+    forest_end_year_true_pixels: int = 0
+    rfm_area_ha: float = 0.0
+    loss_total_2001_2024_ha: float = 0.0
+    loss_2021_2024_ha: float = 0.0
+    forest_end_year_area_ha: float = 0.0
+    forest_2024_area_ha: float = 0.0
+    pixel_area_sum: float = 0.0
+    pixel_area_count: int = 0
+    pixel_area_min: float | None = None
+    pixel_area_max: float | None = None
+    loss_features: list[_EncodedFeature] = field(default_factory=list)
+    current_features: list[_EncodedFeature] = field(default_factory=list)
+    baseline_features: list[_EncodedFeature] = field(default_factory=list)
+    end_year_features: list[_EncodedFeature] = field(default_factory=list)
+    tree_sha256: str = ""
+    loss_sha256: str = ""
+
+
+# Block cache and warp memory budgets (MB) shared by all tile workers of one run.
+GDAL_TILE_CACHEMAX_MB = 512
+REPROJECT_WARP_MEM_LIMIT_MB = 512
+
+
+def _gdal_tile_options(workers: int) -> dict[str, Any]:
+    """GDAL settings for reading Hansen tiles with ``workers`` concurrent tile pairs.
+
+    The block cache and decode threads are split across workers so a parallel run
+    neither oversubscribes the CPUs nor multiplies the cache footprint. PROJ grid
+    downloads stay off so reprojection never waits on (or varies with) the network.
+    """
+
+    cpus = os.cpu_count() or 1
+    return {
+        "GDAL_CACHEMAX": max(64, GDAL_TILE_CACHEMAX_MB // workers),
+        "GDAL_NUM_THREADS": "ALL_CPUS" if workers == 1 else str(max(1, cpus // workers)),
+        "PROJ_NETWORK": "OFF",
+    }
+
+
+def _gdal_thread_count(gdal_options: dict[str, Any] | None) -> int:
+    threads = str((gdal_options or {}).get("GDAL_NUM_THREADS", "1"))
+    if threads == "ALL_CPUS":
+        return os.cpu_count() or 1
+    return max(1, int(threads))
+
+
+def _process_tile_pair(
+    pair: tuple[Path, Path],
+    *,
+    geom: dict[str, Any],
+    zone_geom: dict[str, Any] | None,
+    config: HansenConfig,
+    end_year: int,
+    cutoff_threshold: int,
+    gdal_options: dict[str, Any] | None = None,
+    warp_mem_limit_mb: int = 0,
+    zone_in_projected_crs: Callable[[], dict[str, Any]] | None = None,
+) -> _TilePairStats:
+    """Compute one treecover2000/lossyear tile pair's contribution to the AOI totals.
+
+    Free of shared state so tile pairs can run concurrently in worker threads.
+    ``zone_geom`` is the WGS84 zone as GeoJSON (None when empty), converted once by
+    the caller so workers receive plain data instead of a shapely geometry;
+    ``zone_in_projected_crs`` lazily returns the same zone in ``config.projected_crs``
+    (shared across tiles so it is transformed at most once); it is only used when the
+    tile actually landed in that CRS, not after a fallback reprojection.
+    ``gdal_options`` are applied through `rasterio.Env` around the tile reads;
+    ``warp_mem_limit_mb`` caps the reprojection working buffer (0: GDAL default).
+    """
+
+    tree_path, loss_path = pair
     forest_loss_ha = 0.0
     initial_cover_ha = 0.0
     current_cover_ha = 0.0
@@ -466,17 +942,11 @@ def compute_forest_loss_post_2020(
     loss_post_2020_true_pixels = 0
     tree_nodata_pixels = 0
     lossyear_nodata_pixels = 0
-
-    end_year = infer_hansen_latest_year(
-        dataset_version=config.dataset_version,
-        tile_dir=config.tile_dir,
-    )
     rfm_area_ha = np.float64(0.0)
     loss_total_2001_2024_ha = np.float64(0.0)
     loss_2021_2024_ha = np.float64(0.0)
     forest_end_year_area_ha = np.float64(0.0)
     forest_2024_area_ha = np.float64(0.0)
-
     raster_shapes: list[tuple[int, int]] = []
     pixel_area_sum = np.float64(0.0)
     pixel_area_count = 0
@@ -486,84 +956,95 @@ def compute_forest_loss_post_2020(
     loss_21_24_true_pixels = 0
     forest_end_year_true_pixels = 0
     crs_values: list[str] = []
-
-    provenance: list[TileProvenance] = []
-    loss_features: list[dict[str, Any]] = []
-    current_features: list[dict[str, Any]] = []
-    baseline_features: list[dict[str, Any]] = []
-    end_year_features: list[dict[str, Any]] = []
-
-    cutoff_threshold = max(config.cutoff_year - 2000, 0)
+    loss_features: list[_EncodedFeature] = []
+    current_features: list[_EncodedFeature] = []
+    baseline_features: list[_EncodedFeature] = []
+    end_year_features: list[_EncodedFeature] = []
     used_projected = False
 
-    for tree_path, loss_path in pairs:
-        try:
-            with rasterio.open(tree_path) as tree_ds, rasterio.open(loss_path) as loss_ds:
-                tree_data, tree_transform = _mask_raster(tree_ds, geom)
-                loss_data, _ = _mask_raster(loss_ds, geom)
-
-                if tree_data.shape != loss_data.shape:
-                    raise RuntimeError("Mismatched raster shapes for treecover2000 and lossyear")
-
-                tree_band = tree_data[0]
-                loss_band = loss_data[0]
-                tree_mask = np.ma.getmaskarray(tree_band)
-                loss_mask = np.ma.getmaskarray(loss_band)
-                valid_original = (~tree_mask) & (~loss_mask)
-
-                loss_band_optional = _extract_loss_band(loss_ds)
-                if loss_band_optional is not None:
-                    loss_optional_values = np.ma.filled(loss_band_optional, 0)
-                    _warn_loss_consistency(
-                        np.ma.filled(loss_band, 0),
-                        loss_optional_values,
-                        valid_original & (~loss_band_optional.mask),
-                    )
+    try:
+        with (
+            rasterio.Env(**(gdal_options or {})),
+            rasterio.open(tree_path, sharing=False) as tree_ds,
+            rasterio.open(loss_path, sharing=False) as loss_ds,
+        ):
+            window, outside, tree_transform = _aoi_window(tree_ds, geom)
+            if (
+                loss_ds.crs == tree_ds.crs
+                and loss_ds.transform == tree_ds.transform
+                and loss_ds.shape == tree_ds.shape
+            ):
+                # Paired Hansen layers share one grid: rasterize the AOI once.
+                loss_window, loss_outside = window, outside
+            else:
+                loss_window, loss_outside, _ = _aoi_window(loss_ds, geom)
+            tree_values, tree_mask = _read_aoi_band(tree_ds, window, outside)
+            loss_values, loss_mask = _read_aoi_band(loss_ds, loss_window, loss_outside)
+
+            if tree_values.shape != loss_values.shape:
+                raise RuntimeError("Mismatched raster shapes for treecover2000 and lossyear")
+
+            # The optional loss band only feeds a consistency warning: skip the read
+            # entirely when nobody would see it.
+            loss_band_idx = (
+                _loss_band_index(loss_ds)
+                if loss_window is not None and LOGGER.isEnabledFor(logging.WARNING)
+                else None
+            )
+            if loss_band_idx is not None:
+                loss_band_optional = loss_ds.read(loss_band_idx, window=loss_window, masked=True)
+                loss_optional_values = np.ma.filled(loss_band_optional, 0)
+                _warn_loss_consistency(
+                    loss_values,
+                    loss_optional_values,
+                    (~tree_mask) & (~loss_mask) & (~np.ma.getmaskarray(loss_band_optional)),
+                )
+            active_transform = tree_transform
+            active_crs = tree_ds.crs
+            if (
+                config.reproject_to_projected
+                and active_crs is not None
+                and active_crs.is_geographic
+            ):
+                (
+                    tree_values,
+                    loss_values,
+                    tree_mask,
+                    loss_mask,
+                    active_transform,
+                    active_crs,
+                ) = _reproject_to_projected(
+                    tree_ds=tree_ds,
+                    loss_ds=loss_ds,
+                    tree_values=tree_values,
+                    loss_values=loss_values,
+                    tree_mask=tree_mask,
+                    loss_mask=loss_mask,
+                    src_transform=active_transform,
+                    src_crs=active_crs,
+                    target_crs=config.projected_crs,
+                    num_threads=_gdal_thread_count(gdal_options),
+                    warp_mem_limit_mb=warp_mem_limit_mb,
+                )
+                used_projected = True
+
+            tree_values = _as_uint8_if_lossless(tree_values)
+            loss_values = _as_uint8_if_lossless(loss_values)
+            raster_shapes.append((int(tree_values.shape[0]), int(tree_values.shape[1])))
+            if active_crs:
+                crs_values.append(active_crs.to_string())
 
-                tree_values = np.ma.filled(tree_band, 0)
-                loss_values = np.ma.filled(loss_band, 0)
-                active_transform = tree_transform
-                active_crs = tree_ds.crs
+            zone_mask = np.zeros(tree_values.shape, dtype=bool)
+            if zone_geom is not None:
                 if (
-                    config.reproject_to_projected
-                    and active_crs is not None
-                    and active_crs.is_geographic
+                    used_projected
+                    and zone_in_projected_crs is not None
+                    and active_crs == CRS.from_user_input(config.projected_crs)
                 ):
-                    (
-                        tree_values,
-                        loss_values,
-                        tree_mask,
-                        loss_mask,
-                        active_transform,
-                        active_crs,
-                    ) = _reproject_to_projected(
-                        tree_ds=tree_ds,
-                        loss_ds=loss_ds,
-                        tree_values=tree_values,
-                        loss_values=loss_values,
-                        tree_mask=tree_mask,
-                        loss_mask=loss_mask,
-                        src_transform=active_transform,
-                        src_crs=active_crs,
-                        target_crs=config.projected_crs,
-                    )
-                    used_projected = True
-
-                valid = (~tree_mask) & (~loss_mask)
-                raster_shapes.append((int(tree_values.shape[0]), int(tree_values.shape[1])))
-                if active_crs:
-                    crs_values.append(active_crs.to_string())
-
-                rfm = rfm_mask(tree_values, config.canopy_threshold_percent)
-                baseline = valid & rfm
-                loss_post_2020 = baseline & (loss_values > cutoff_threshold)
-                current_cover = baseline & (loss_values == 0)
-
-                if zone_shape is None or zone_shape.is_empty:
-                    zone_mask = np.zeros(tree_values.shape, dtype=bool)
+                    zone_in_crs = zone_in_projected_crs()
                 else:
-                    zone_geom = mapping(zone_shape)
-                    zone_in_crs = transform_geom("EPSG:4326", active_crs, zone_geom)
+                    zone_in_crs = _geom_in_crs(zone_geom, active_crs)
+                if not _zone_misses_grid(zone_in_crs, active_transform, tree_values.shape):
                     zone_mask = rasterize_zone_mask(
                         zone_in_crs,
                         out_shape=tree_values.shape,
@@ -571,122 +1052,320 @@ def compute_forest_loss_post_2020(
                         all_touched=True,
                     )
 
-                pixel_area_m2 = pixel_area_m2_raster(
-                    active_transform,
-                    height=tree_values.shape[0],
-                    width=tree_values.shape[1],
-                    crs=active_crs,
+            end_code = end_year - 2000
+            tallies = _zone_row_tallies(
+                tree_values,
+                loss_values,
+                tree_mask,
+                loss_mask,
+                zone_mask,
+                canopy_threshold=config.canopy_threshold_percent,
+                cutoff_code=cutoff_threshold,
+                end_code=end_code,
+            )
+            totals = tallies.sum(axis=0)
+            rfm_true_pixels += int(totals[_TALLY_RFM])
+            loss_21_24_true_pixels += int(totals[_TALLY_LOSS_RECENT])
+            forest_end_year_true_pixels += int(totals[_TALLY_FOREST_END])
+            current_forest_true_pixels += int(totals[_TALLY_CURRENT])
+            loss_post_2020_true_pixels += int(totals[_TALLY_LOSS_POST_2020])
+            tree_nodata_pixels += int(totals[_TALLY_TREE_NODATA])
+            lossyear_nodata_pixels += int(totals[_TALLY_LOSS_NODATA])
+
+            height = tree_values.shape[0]
+            row_area_m2: np.ndarray | None = None
+            if active_transform.b == 0 and active_transform.d == 0:
+                # North-up grid: pixel area is constant along a row, so every area is a
+                # row-count weighted sum and the full pixel_area_m2 grid is never built.
+                row_pixel_area_m2 = pixel_area_m2_raster(
+                    active_transform, height=height, width=1, crs=active_crs
                 )
-                rfm_zone_mask = rfm & valid
-                loss_total_mask_bool = loss_total_mask(
-                    tree_values,
-                    loss_values,
-                    config.canopy_threshold_percent,
-                ) & valid
-                loss_recent_mask = loss_mask_range(
-                    tree_values,
-                    loss_values,
-                    config.canopy_threshold_percent,
-                    2021,
-                    end_year,
-                ) & valid
-                forest_2024_mask_bool = forest_2024_mask(
-                    tree_values,
-                    loss_values,
-                    config.canopy_threshold_percent,
-                ) & valid
-                forest_end_mask = forest_mask_end_year(
+                if getattr(active_crs, "is_projected", False):
+                    row_area_m2 = row_pixel_area_m2[:, 0]
+                else:
+                    row_area_m2 = _geodesic_row_area_m2(
+                        active_crs, active_transform, row_pixel_area_m2
+                    )
+
+            masks: _ForestMasks | None = None
+            if row_area_m2 is None or config.write_masks:
+                masks = _forest_masks(
                     tree_values,
                     loss_values,
-                    config.canopy_threshold_percent,
-                    end_year,
-                ) & valid
+                    (~tree_mask) & (~loss_mask),
+                    zone_mask,
+                    canopy_threshold=config.canopy_threshold_percent,
+                    cutoff_code=cutoff_threshold,
+                    end_code=end_code,
+                )
 
-                loss_post_2020_zone = loss_post_2020 & zone_mask
-                current_cover_zone = current_cover & zone_mask
-                baseline_zone = baseline & zone_mask
+            if row_area_m2 is not None:
+                zone_valid_rows = np.flatnonzero(tallies[:, _TALLY_ZONE_VALID])
+                if zone_valid_rows.size:
+                    zone_row_areas = row_area_m2[zone_valid_rows]
+                    vmin = float(np.min(zone_row_areas))
+                    vmax = float(np.max(zone_row_areas))
+                    pixel_area_sum += np.float64(
+                        np.dot(tallies[zone_valid_rows, _TALLY_ZONE_VALID], zone_row_areas)
+                    )
+                    pixel_area_count += int(totals[_TALLY_ZONE_VALID])
+                    pixel_area_min = vmin if pixel_area_min is None else min(pixel_area_min, vmin)
+                    pixel_area_max = vmax if pixel_area_max is None else max(pixel_area_max, vmax)
 
-                zone_valid = zone_mask & valid
-                if np.any(zone_valid):
-                    pixel_vals = pixel_area_m2[zone_valid]
-                    if pixel_vals.size:
-                        vmin = float(np.min(pixel_vals))
-                        vmax = float(np.max(pixel_vals))
-                        vsum = np.sum(pixel_vals, dtype=np.float64)
-                        pixel_area_sum += np.float64(vsum)
-                        pixel_area_count += int(pixel_vals.size)
-                        pixel_area_min = vmin if pixel_area_min is None else min(pixel_area_min, vmin)
-                        pixel_area_max = vmax if pixel_area_max is None else max(pixel_area_max, vmax)
-
-                rfm_true_pixels += int(np.count_nonzero(rfm_zone_mask & zone_mask))
-                loss_21_24_true_pixels += int(np.count_nonzero(loss_recent_mask & zone_mask))
-                forest_end_year_true_pixels += int(
-                    np.count_nonzero(forest_end_mask & zone_mask)
+                rfm_area_ha += np.float64(_tally_area_ha(tallies, _TALLY_RFM, row_area_m2))
+                loss_total_2001_2024_ha += np.float64(
+                    _tally_area_ha(tallies, _TALLY_LOSS_TOTAL, row_area_m2)
                 )
-                current_forest_true_pixels += int(
-                    np.count_nonzero(current_cover_zone & zone_mask)
+                loss_2021_2024_ha += np.float64(
+                    _tally_area_ha(tallies, _TALLY_LOSS_RECENT, row_area_m2)
+                )
+                forest_end_year_area_ha += np.float64(
+                    _tally_area_ha(tallies, _TALLY_FOREST_END, row_area_m2)
                 )
-                loss_post_2020_true_pixels += int(
-                    np.count_nonzero(loss_post_2020_zone & zone_mask)
+                forest_2024_area_ha += np.float64(
+                    _tally_area_ha(tallies, _TALLY_CURRENT, row_area_m2)
                 )
-                tree_nodata_pixels += int(np.count_nonzero(tree_mask & zone_mask))
-                lossyear_nodata_pixels += int(np.count_nonzero(loss_mask & zone_mask))
 
-                rfm_area_ha += np.float64(zonal_area_ha(rfm_zone_mask, pixel_area_m2, zone_mask))
-                loss_total_2001_2024_ha += np.float64(
-                    zonal_area_ha(loss_total_mask_bool, pixel_area_m2, zone_mask)
+                # Same values _compute_area_ha yields for these grids: a constant pixel
+                # area when projected, else the geodesic row areas in row_area_m2.
+                if getattr(active_crs, "is_projected", False):
+                    pixel_ha = _pixel_area_ha_projected(active_transform)
+                    area_loss = float(totals[_TALLY_LOSS_POST_2020]) * pixel_ha
+                    area_initial = float(totals[_TALLY_RFM]) * pixel_ha
+                    area_current = float(totals[_TALLY_CURRENT]) * pixel_ha
+                else:
+                    area_loss = _tally_area_ha(tallies, _TALLY_LOSS_POST_2020, row_area_m2)
+                    area_initial = _tally_area_ha(tallies, _TALLY_RFM, row_area_m2)
+                    area_current = _tally_area_ha(tallies, _TALLY_CURRENT, row_area_m2)
+            else:
+                pixel_area_m2 = pixel_area_m2_raster(
+                    active_transform,
+                    height=height,
+                    width=tree_values.shape[1],
+                    crs=active_crs,
                 )
-                loss_2021_2024_ha += np.float64(
-                    zonal_area_ha(loss_recent_mask, pixel_area_m2, zone_mask)
+                zone_valid = masks.zone_valid
+                if np.any(zone_valid):
+                    pixel_vals = pixel_area_m2[zone_valid]
+                    vmin = float(np.min(pixel_vals))
+                    vmax = float(np.max(pixel_vals))
+                    pixel_area_sum += np.float64(np.sum(pixel_vals, dtype=np.float64))
+                    pixel_area_count += int(pixel_vals.size)
+                    pixel_area_min = vmin if pixel_area_min is None else min(pixel_area_min, vmin)
+                    pixel_area_max = vmax if pixel_area_max is None else max(pixel_area_max, vmax)
+
+                rfm_area_ha += np.float64(_masked_area_ha(masks.baseline, pixel_area_m2))
+                loss_total_2001_2024_ha += np.float64(
+                    _masked_area_ha(masks.loss_total, pixel_area_m2)
                 )
+                loss_2021_2024_ha += np.float64(_masked_area_ha(masks.loss_recent, pixel_area_m2))
                 forest_end_year_area_ha += np.float64(
-                    zonal_area_ha(forest_end_mask, pixel_area_m2, zone_mask)
+                    _masked_area_ha(masks.forest_end, pixel_area_m2)
                 )
                 forest_2024_area_ha += np.float64(
-                    zonal_area_ha(forest_2024_mask_bool, pixel_area_m2, zone_mask)
+                    _masked_area_ha(masks.current_cover, pixel_area_m2)
                 )
+                area_loss = _compute_area_ha(active_crs, active_transform, masks.loss_post_2020)
+                area_initial = _compute_area_ha(active_crs, active_transform, masks.baseline)
+                area_current = _compute_area_ha(active_crs, active_transform, masks.current_cover)
+
+            forest_loss_ha += area_loss
+            initial_cover_ha += area_initial
+            current_cover_ha += area_current
+
+            if config.write_masks:
+                for features, mask in (
+                    (loss_features, masks.loss_post_2020),
+                    (current_features, masks.current_cover),
+                    (baseline_features, masks.baseline),
+                    (end_year_features, masks.forest_end),
+                ):
+                    features.extend(
+                        _encode_mask_features(_mask_features(mask, active_transform, active_crs))
+                    )
+    except RasterioIOError as exc:
+        raise RuntimeError(f"Failed to read Hansen tile: {exc}") from exc
+
+    return _TilePairStats(
+        raster_shape=raster_shapes[0],
+        crs=crs_values[0] if crs_values else "",
+        used_projected=used_projected,
+        forest_loss_ha=forest_loss_ha,
+        initial_cover_ha=initial_cover_ha,
+        current_cover_ha=current_cover_ha,
+        current_forest_true_pixels=current_forest_true_pixels,
+        loss_post_2020_true_pixels=loss_post_2020_true_pixels,
+        tree_nodata_pixels=tree_nodata_pixels,
+        lossyear_nodata_pixels=lossyear_nodata_pixels,
+        rfm_true_pixels=rfm_true_pixels,
+        loss_21_24_true_pixels=loss_21_24_true_pixels,
+        forest_end_year_true_pixels=forest_end_year_true_pixels,
+        rfm_area_ha=rfm_area_ha,
+        loss_total_2001_2024_ha=loss_total_2001_2024_ha,
+        loss_2021_2024_ha=loss_2021_2024_ha,
+        forest_end_year_area_ha=forest_end_year_area_ha,
+        forest_2024_area_ha=forest_2024_area_ha,
+        pixel_area_sum=pixel_area_sum,
+        pixel_area_count=pixel_area_count,
+        pixel_area_min=pixel_area_min,
+        pixel_area_max=pixel_area_max,
+        loss_features=loss_features,
+        current_features=current_features,
+        baseline_features=baseline_features,
+        end_year_features=end_year_features,
+        tree_sha256=sha256_tile_cached(tree_path),
+        loss_sha256=sha256_tile_cached(loss_path),
+    )
 
-                area_loss = _compute_area_ha(active_crs, active_transform, loss_post_2020_zone)
-                area_initial = _compute_area_ha(active_crs, active_transform, baseline_zone)
-                area_current = _compute_area_ha(active_crs, active_transform, current_cover_zone)
 
-                forest_loss_ha += area_loss
-                initial_cover_ha += area_initial
-                current_cover_ha += area_current
+def compute_forest_loss_post_2020(
+    *,
+    aoi_geojson_path: Path,
+    output_dir: Path,
+    config: HansenConfig,
+    zone_geom_wgs84: dict[str, Any] | None = None,
+    parcel_ids: list[str] | None = None,
+) -> ForestLossResult:
+    tile_source = LocalTileSource(config.tile_dir)
 
-                if config.write_masks:
-                    loss_features.extend(
-                        _mask_features(loss_post_2020_zone, active_transform, active_crs)
-                    )
-                    current_features.extend(
-                        _mask_features(current_cover_zone, active_transform, active_crs)
-                    )
-                    baseline_features.extend(
-                        _mask_features(baseline_zone, active_transform, active_crs)
-                    )
-                    end_year_features.extend(
-                        _mask_features(forest_end_mask & zone_mask, active_transform, active_crs)
-                    )
-        except RasterioIOError as exc:
-            raise RuntimeError(f"Failed to read Hansen tile: {exc}") from exc
+    pairs = _pairs_for_tile_ids(config.tile_dir, config.tile_ids)
+    if pairs is None:
+        treecover_tiles = tile_source.list_layer_files("treecover2000")
+        lossyear_tiles = tile_source.list_layer_files("lossyear")
+        pairs = _pair_tiles(treecover_tiles, lossyear_tiles)
+
+    geom = _load_aoi_geometry(aoi_geojson_path)
+    aoi_shape = shape(geom)
+    if zone_geom_wgs84 is None:
+        zone_shape = aoi_shape
+    else:
+        zone_shape = shape(zone_geom_wgs84)
+        zone_shape = zone_shape.intersection(aoi_shape)
+
+    forest_loss_ha = 0.0
+    initial_cover_ha = 0.0
+    current_cover_ha = 0.0
+    current_forest_true_pixels = 0
+    loss_post_2020_true_pixels = 0
+    tree_nodata_pixels = 0
+    lossyear_nodata_pixels = 0
+
+    end_year = infer_hansen_latest_year(
+        dataset_version=config.dataset_version,
+        tile_dir=config.tile_dir,
+    )
+    rfm_area_ha = np.float64(0.0)
+    loss_total_2001_2024_ha = np.float64(0.0)
+    loss_2021_2024_ha = np.float64(0.0)
+    forest_end_year_area_ha = np.float64(0.0)
+    forest_2024_area_ha = np.float64(0.0)
+
+    raster_shapes: list[tuple[int, int]] = []
+    pixel_area_sum = np.float64(0.0)
+    pixel_area_count = 0
+    pixel_area_min: float | None = None
+    pixel_area_max: float | None = None
+    rfm_true_pixels = 0
+    loss_21_24_true_pixels = 0
+    forest_end_year_true_pixels = 0
+    crs_values: list[str] = []
+
+    provenance: list[TileProvenance] = []
+    loss_features: list[_EncodedFeature] = []
+    current_features: list[_EncodedFeature] = []
+    baseline_features: list[_EncodedFeature] = []
+    end_year_features: list[_EncodedFeature] = []
+
+    cutoff_threshold = max(config.cutoff_year - 2000, 0)
+    used_projected = False
+
+    zone_geom = None if zone_shape.is_empty else mapping(zone_shape)
+    zone_in_projected_crs: Callable[[], dict[str, Any]] | None = None
+    if zone_geom is not None and config.reproject_to_projected:
+        # Reprojected tiles share one target CRS: transform the zone on first use only.
+        zone_in_projected_crs = cache(
+            partial(transform_geom, "EPSG:4326", config.projected_crs, zone_geom)
+        )
+
+    max_workers = min(len(pairs), os.cpu_count() or 1)
+    worker = partial(
+        _process_tile_pair,
+        geom=geom,
+        zone_geom=zone_geom,
+        zone_in_projected_crs=zone_in_projected_crs,
+        config=config,
+        end_year=end_year,
+        cutoff_threshold=cutoff_threshold,
+        gdal_options=_gdal_tile_options(max(max_workers, 1)),
+        warp_mem_limit_mb=max(64, REPROJECT_WARP_MEM_LIMIT_MB // max(max_workers, 1)),
+    )
+    if len(pairs) > 1:
+        # Tile pairs are independent; fan them out, then reduce in pair order so the
+        # floating-point accumulation (and therefore the output) stays deterministic.
+        # Threads, not processes: GDAL reads, warps and the tally kernel release the
+        # GIL, and forking after numba has started its thread pool deadlocks.
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            tile_stats = list(pool.map(worker, pairs))
+    else:
+        tile_stats = [worker(pair) for pair in pairs]
+
+    for (tree_path, loss_path), stats in zip(pairs, tile_stats):
+        raster_shapes.append(stats.raster_shape)
+        if stats.crs:
+            crs_values.append(stats.crs)
+        used_projected = used_projected or stats.used_projected
+
+        forest_loss_ha += stats.forest_loss_ha
+        initial_cover_ha += stats.initial_cover_ha
+        current_cover_ha += stats.current_cover_ha
+        current_forest_true_pixels += stats.current_forest_true_pixels
+        loss_post_2020_true_pixels += stats.loss_post_2020_true_pixels
+        tree_nodata_pixels += stats.tree_nodata_pixels
+        lossyear_nodata_pixels += stats.lossyear_nodata_pixels
+        rfm_true_pixels += stats.rfm_true_pixels
+        loss_21_24_true_pixels += stats.loss_21_24_true_pixels
+        forest_end_year_true_pixels += stats.forest_end_year_true_pixels
+
+        rfm_area_ha += stats.rfm_area_ha
+        loss_total_2001_2024_ha += stats.loss_total_2001_2024_ha
+        loss_2021_2024_ha += stats.loss_2021_2024_ha
+        forest_end_year_area_ha += stats.forest_end_year_area_ha
+        forest_2024_area_ha += stats.forest_2024_area_ha
+
+        if stats.pixel_area_count:
+            pixel_area_sum += stats.pixel_area_sum
+            pixel_area_count += stats.pixel_area_count
+            pixel_area_min = (
+                stats.pixel_area_min
+                if pixel_area_min is None
+                else min(pixel_area_min, stats.pixel_area_min)
+            )
+            pixel_area_max = (
+                stats.pixel_area_max
+                if pixel_area_max is None
+                else max(pixel_area_max, stats.pixel_area_max)
+            )
+
+        loss_features.extend(stats.loss_features)
+        current_features.extend(stats.current_features)
+        baseline_features.extend(stats.baseline_features)
+        end_year_features.extend(stats.end_year_features)
 
         provenance.append(
             TileProvenance(
                 layer="treecover2000",
                 relpath=tile_source.tile_relpath(tree_path),
-                sha256=sha256_file(tree_path),
+                sha256=stats.tree_sha256,
             )
         )
         provenance.append(
             TileProvenance(
                 layer="lossyear",
                 relpath=tile_source.tile_relpath(loss_path),
-                sha256=sha256_file(loss_path),
+                sha256=stats.loss_sha256,
             )
         )
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     loss_mask_path = output_dir / "forest_loss_post_2020_mask.geojson"
     current_mask_path = output_dir / "forest_current_tree_cover_mask.geojson"
     forest_2000_mask_path = output_dir / "forest_2000_tree_cover_mask.geojson"
@@ -837,17 +1516,20 @@ def load_hansen_config(
             )
             tile_ids, tile_entries = _entries_from_manifest(manifest_path)
         else:
-            bbox = load_aoi_bbox(aoi_geojson_path)
-            tile_ids = hansen_tile_ids_for_bbox(bbox)
-            tile_entries = []
-            for tile_id in tile_ids:
-                tile_entries.extend(
-                    ensure_hansen_layers_present(
-                        tile_id,
-                        ["treecover2000", "lossyear"],
-                        download=download,
-                    )
-                )
+            tile_ids = hansen_tile_ids_for_bbox(load_aoi_bbox(aoi_geojson_path))
+            ensure_tile = partial(
+                ensure_hansen_layers_present,
+                layers=["treecover2000", "lossyear"],
+                download=download,
+            )
+            if len(tile_ids) > 1:
+                # Presence checks, hashing and downloads are I/O bound: overlap them
+                # across tiles. map() keeps the entries in tile_ids order.
+                with ThreadPoolExecutor(max_workers=min(8, len(tile_ids))) as pool:
+                    per_tile = list(pool.map(ensure_tile, tile_ids))
+            else:
+                per_tile = [ensure_tile(tile_id) for tile_id in tile_ids]
+            tile_entries = [entry for entries in per_tile for entry in entries]
     if not tile_source:
         tile_source = "minio-cache" if minio_cache_enabled else "local"
 
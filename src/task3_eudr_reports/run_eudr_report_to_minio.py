@@ -21,6 +21,29 @@ _REQUIRED_MINIO_ENV = (
     "MINIO_BUCKET",
 )
 
+_MISSING_MINIO_ENV_TEMPLATE = textwrap.dedent(
+    """\
+    Missing required MinIO environment variables: {missing}
+
+    Required:
+      - MINIO_ENDPOINT (e.g. localhost:9000)
+      - MINIO_ACCESS_KEY
+      - MINIO_SECRET_KEY
+      - MINIO_BUCKET
+
+    Tip (local docker compose default credentials):
+      export MINIO_ENDPOINT=localhost:9000
+      export MINIO_ACCESS_KEY=minioadmin
+      export MINIO_SECRET_KEY=minioadmin
+      export MINIO_BUCKET=eudr-reports
+    """
+)
+
+_SHIM_NOT_IMPLEMENTED_MESSAGE = (
+    "src/task3_eudr_reports/run_eudr_report_to_minio.py is a compatibility shim. "
+    "Add the report generation + MinIO upload implementation here when ready."
+)
+
 
 def _env_optional(name: str) -> str | None:
     value = os.getenv(name)
@@ -30,29 +53,13 @@ def _env_optional(name: str) -> str | None:
 
 
 def _require_minio_env() -> dict[str, str]:
-    missing = [name for name in _REQUIRED_MINIO_ENV if not _env_optional(name)]
+    # One lookup per variable: the returned values are exactly the ones validated.
+    values = {name: _env_optional(name) for name in _REQUIRED_MINIO_ENV}
+    missing = [name for name, value in values.items() if value is None]
     if missing:
-        raise SystemExit(
-            textwrap.dedent(
-                """\
-                Missing required MinIO environment variables: {missing}
-
-                Required:
-                  - MINIO_ENDPOINT (e.g. localhost:9000)
-                  - MINIO_ACCESS_KEY
-                  - MINIO_SECRET_KEY
-                  - MINIO_BUCKET
-
-                Tip (local docker compose default credentials):
-                  export MINIO_ENDPOINT=localhost:9000
-                  export MINIO_ACCESS_KEY=minioadmin
-                  export MINIO_SECRET_KEY=minioadmin
-                  export MINIO_BUCKET=eudr-reports
-                """
-            ).format(missing=", ".join(missing))
-        )
+        raise SystemExit(_MISSING_MINIO_ENV_TEMPLATE.format(missing=", ".join(missing)))
 
-    return {name: str(os.environ[name]) for name in _REQUIRED_MINIO_ENV}
+    return {name: str(value) for name, value in values.items()}
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -88,10 +95,7 @@ def main(argv: list[str] | None = None) -> int:
     if not args.skip_minio:
         _require_minio_env()
 
-    raise SystemExit(
-        "src/task3_eudr_reports/run_eudr_report_to_minio.py is a compatibility shim. "
-        "Add the report generation + MinIO upload implementation here when ready."
-    )
+    raise SystemExit(_SHIM_NOT_IMPLEMENTED_MESSAGE)
 
 
 if __name__ == "__main__":
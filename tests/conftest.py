@@ -3,6 +3,16 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
-_SRC = (Path(__file__).resolve().parents[1] / "src").as_posix()
+# conftest.py is imported with an absolute __file__; no realpath() needed.
+_SRC = (Path(__file__).parent.parent / "src").as_posix()
 if _SRC not in sys.path:
     sys.path.insert(0, _SRC)
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption(
+        "--cli-subprocess",
+        action="store_true",
+        default=False,
+        help="Run CLI smoke tests through `python -m` instead of in-process.",
+    )
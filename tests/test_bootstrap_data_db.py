@@ -53,7 +53,8 @@ class TestBootstrapDataDb(unittest.TestCase):
             db_path = data_dir / "test_geodata_catalogue.duckdb"
             self.assertTrue(db_path.exists())
 
-            con = duckdb.connect(str(db_path))
+            # Read-only: a shared lock, no WAL/checkpoint work on close.
+            con = duckdb.connect(str(db_path), read_only=True)
             try:
                 tables = {
                     r[0]
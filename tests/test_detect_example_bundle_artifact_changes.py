@@ -29,19 +29,32 @@ def _make_report_html(generated: str, relpaths: list[str]) -> str:
 
 
 class FetchStub:
-    def __init__(self, html: str, artifacts: dict[str, bytes]) -> None:
+    def __init__(
+        self, html: str, artifacts: dict[str, bytes], etags: dict[str, str] | None = None
+    ) -> None:
         self.html = html.encode("utf-8")
         self.artifacts = artifacts
+        self.etags = etags or {}
+        self.body_bytes_transferred = 0
 
     def __call__(self, url: str, headers: dict[str, str] | None = None):
+        etag = self.etags.get(url)
+        resp_headers = {"ETag": etag} if etag else {}
+        if etag and (headers or {}).get("If-None-Match") == etag:
+            return 304, b"", resp_headers
         if url == REPORT_URL:
-            return 200, self.html, {}
-        if url in self.artifacts:
-            return 200, self.artifacts[url], {}
-        raise RuntimeError(f"Unexpected URL: {url}")
-
-
-def _run_detector(tmp_path: Path, local_root: Path, fetch: FetchStub) -> int:
+            body = self.html
+        elif url in self.artifacts:
+            body = self.artifacts[url]
+        else:
+            raise RuntimeError(f"Unexpected URL: {url}")
+        self.body_bytes_transferred += len(body)
+        return 200, body, resp_headers
+
+
+def _run_detector(
+    tmp_path: Path, local_root: Path, fetch: FetchStub, extra_args: list[str] | None = None
+) -> int:
     out_dir = tmp_path / "out"
     cache_dir = tmp_path / "cache"
     baseline = tmp_path / "baseline.json"
@@ -66,6 +79,7 @@ def _run_detector(tmp_path: Path, local_root: Path, fetch: FetchStub) -> int:
                 str(instructions),
                 "--out-dir",
                 str(out_dir),
+                *(extra_args or []),
             ]
         )
     finally:
@@ -138,3 +152,63 @@ def test_missing_local_exit_three(tmp_path: Path) -> None:
     out_dir = tmp_path / "out"
     diff_summary = json.loads((out_dir / "diff_summary.json").read_text(encoding="utf-8"))
     assert diff_summary["diff"]["missing_locally"] == relpaths
+
+
+def test_unchanged_published_artifacts_revalidate_without_bodies(tmp_path: Path) -> None:
+    relpaths = ["reports/aoi_report_v2/estonia_testland1.json"]
+    html = _make_report_html("2026-02-06T10:57:34+00:00", relpaths)
+
+    local_root = tmp_path / "run"
+    path = local_root / relpaths[0]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"same")
+
+    artifact_url = f"https://example.test/aoi_reports/runs/example/{relpaths[0]}"
+    etags = {REPORT_URL: '"r1"', artifact_url: '"a1"'}
+
+    first = FetchStub(html, {artifact_url: b"same"}, etags)
+    assert _run_detector(tmp_path, local_root, first) == 0
+    assert first.body_bytes_transferred > 0
+
+    second = FetchStub(html, {artifact_url: b"same"}, etags)
+    assert _run_detector(tmp_path, local_root, second) == 0
+    assert second.body_bytes_transferred == 0
+
+    published = json.loads((tmp_path / "out" / "published_manifest.json").read_text(encoding="utf-8"))
+    assert published["artifacts"][0]["bytes"] == len(b"same")
+
+
+def test_unchanged_local_artifacts_reuse_cached_digests(tmp_path: Path, monkeypatch) -> None:
+    relpaths = ["reports/aoi_report_v2/estonia_testland1.json"]
+    html = _make_report_html("2026-02-06T10:57:34+00:00", relpaths)
+
+    local_root = tmp_path / "run"
+    path = local_root / relpaths[0]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"same")
+    artifact_urls = {f"https://example.test/aoi_reports/runs/example/{relpaths[0]}": b"same"}
+
+    hashed: list[Path] = []
+    real_sha256_file = detector._sha256_file
+
+    def _counting_sha256_file(p: Path) -> str:
+        hashed.append(p)
+        return real_sha256_file(p)
+
+    monkeypatch.setattr(detector, "_sha256_file", _counting_sha256_file)
+
+    assert _run_detector(tmp_path, local_root, FetchStub(html, artifact_urls)) == 0
+    assert path in hashed
+
+    hashed.clear()
+    assert _run_detector(tmp_path, local_root, FetchStub(html, artifact_urls)) == 0
+    assert path not in hashed
+
+    assert _run_detector(tmp_path, local_root, FetchStub(html, artifact_urls), ["--strict-hash"]) == 0
+    assert path in hashed
+
+    # A rewritten file (new size) is hashed again and the change is detected.
+    hashed.clear()
+    path.write_bytes(b"changed")
+    assert _run_detector(tmp_path, local_root, FetchStub(html, artifact_urls)) == 3
+    assert path in hashed
@@ -9,46 +9,78 @@ from pathlib import Path
 
 import pytest
 
+# Variables the child interpreter needs from the parent; everything else is dropped so
+# the subprocess run is hermetic and cheap to spawn.
+_SUBPROCESS_ENV_NAMES = ("PATH", "HOME", "TMPDIR", "LANG", "SYSTEMROOT", "PYTHONPATH")
+_SUBPROCESS_ENV_PREFIXES = ("EUDR_DMI_", "PROJ_", "GDAL_")
 
-def _run_cli(args: list[str], *, env: dict[str, str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
+
+def _subprocess_env() -> dict[str, str]:
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name in _SUBPROCESS_ENV_NAMES or name.startswith(_SUBPROCESS_ENV_PREFIXES)
+    }
+    src_path = str(Path(__file__).resolve().parents[1] / "src")
+    env["PYTHONPATH"] = src_path + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+    return env
+
+
+def _run_cli_subprocess(args: list[str]) -> tuple[int, str]:
+    proc = subprocess.run(
         [sys.executable, "-m", "eudr_dmi_gil.reports.cli", *args],
         check=False,
         text=True,
         capture_output=True,
-        env=env,
+        env=_subprocess_env(),
     )
+    return proc.returncode, proc.stderr
+
 
+def _run_cli_in_process(args: list[str]) -> tuple[int, str]:
+    from eudr_dmi_gil.reports import cli
 
-def test_estonia_testland1_geojson_smoke(tmp_path: Path) -> None:
+    try:
+        return cli.main(args), ""
+    except SystemExit as exc:
+        return (exc.code if isinstance(exc.code, int) else 1), str(exc)
+    except Exception as exc:  # noqa: BLE001 - mirror a failing CLI process
+        return 1, f"{type(exc).__name__}: {exc}"
+
+
+def test_estonia_testland1_geojson_smoke(
+    tmp_path: Path, monkeypatch, request: pytest.FixtureRequest
+) -> None:
     repo_root = Path(__file__).resolve().parents[1]
     geojson_path = repo_root / "aoi_json_examples" / "estonia_testland1.geojson"
     if not geojson_path.is_file():
         pytest.skip("estonia_testland1.geojson not found")
 
     evidence_root = tmp_path / "evidence"
-    env = os.environ.copy()
-    env["EUDR_DMI_EVIDENCE_ROOT"] = str(evidence_root)
+    monkeypatch.setenv("EUDR_DMI_EVIDENCE_ROOT", str(evidence_root))
 
     bundle_id = "estonia_testland1-smoke"
     aoi_id = "estonia_testland1"
 
-    proc = _run_cli(
-        [
-            "--aoi-id",
-            aoi_id,
-            "--aoi-geojson",
-            str(geojson_path),
-            "--bundle-id",
-            bundle_id,
-            "--out-format",
-            "both",
-        ],
-        env=env,
-    )
-
-    if proc.returncode != 0:
-        pytest.skip(f"CLI failed (environment prerequisites missing): {proc.stderr}")
+    args = [
+        "--aoi-id",
+        aoi_id,
+        "--aoi-geojson",
+        str(geojson_path),
+        "--bundle-id",
+        bundle_id,
+        "--out-format",
+        "both",
+    ]
+    # In-process by default (no interpreter start-up or re-import per run);
+    # `--cli-subprocess` exercises the real `python -m` entry point instead.
+    if request.config.getoption("--cli-subprocess"):
+        returncode, stderr = _run_cli_subprocess(args)
+    else:
+        returncode, stderr = _run_cli_in_process(args)
+
+    if returncode != 0:
+        pytest.skip(f"CLI failed (environment prerequisites missing): {stderr}")
 
     bundle_date = datetime.now(timezone.utc).date().strftime("%Y-%m-%d")
     bundle_dir = evidence_root / bundle_date / bundle_id
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
+from functools import cache
 from pathlib import Path
 
 import numpy as np
@@ -30,13 +34,16 @@ def _write_test_raster(path: Path, data: np.ndarray, transform, crs: str) -> Non
         dst.write(data, 1)
 
 
+_GEOD = Geod(ellps="WGS84")
+
+
+@cache
 def _pixel_area_ha_geographic(transform, row: int, col: int) -> float:
-    geod = Geod(ellps="WGS84")
     x0, y0 = transform * (col, row)
     x1, y1 = transform * (col + 1, row + 1)
     lons = [x0, x1, x1, x0]
     lats = [y0, y0, y1, y1]
-    area, _ = geod.polygon_area_perimeter(lons, lats)
+    area, _ = _GEOD.polygon_area_perimeter(lons, lats)
     return abs(area) / 10000.0
 
 
@@ -194,3 +201,432 @@ def test_top10_parcels_mask_not_empty_or_explained(tmp_path: Path) -> None:
         assert features, "Expected non-empty forest mask when true pixels exist"
     else:
         assert debug.get("current_forest_true_pixels", 0) == 0
+
+
+def test_geographic_pixel_area_matches_per_pixel_sum() -> None:
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import (
+        _pixel_area_ha_geographic as area_ha,
+    )
+
+    transform = from_bounds(24.0, 58.0, 24.05, 58.05, 20, 20)
+    mask = np.random.default_rng(0).random((20, 20)) < 0.3
+
+    expected = sum(
+        _pixel_area_ha_geographic(transform, row, col) for row, col in zip(*np.where(mask))
+    )
+    assert area_ha(transform, mask) == pytest.approx(expected, rel=1e-12)
+    assert area_ha(transform, np.zeros((20, 20), dtype=bool)) == 0.0
+
+    from eudr_dmi_gil.geo.forest_area_core import pixel_area_m2_raster
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import _geodesic_row_area_m2
+
+    crs = rasterio.crs.CRS.from_epsg(4326)
+    row_area_m2 = _geodesic_row_area_m2(
+        crs, transform, pixel_area_m2_raster(transform, height=20, width=20, crs=crs)
+    )
+    assert row_area_m2 is not None
+    assert area_ha(transform, mask, row_area_m2) == area_ha(transform, mask)
+
+
+def test_pair_tiles_reports_every_unmatched_tile() -> None:
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import _pair_tiles
+
+    tiles = Path("tiles")
+    assert _pair_tiles(
+        [tiles / "N50_E020" / "treecover2000.tif"], [tiles / "N50_E020" / "lossyear.tif"]
+    ) == [(tiles / "N50_E020" / "treecover2000.tif", tiles / "N50_E020" / "lossyear.tif")]
+
+    # A single tile per layer pairs whatever the layout, e.g. a flat treecover2000.tif
+    # next to a lossyear tile in a subdirectory.
+    assert _pair_tiles([tiles / "treecover2000.tif"], [tiles / "N60" / "lossyear.tif"]) == [
+        (tiles / "treecover2000.tif", tiles / "N60" / "lossyear.tif")
+    ]
+
+    with pytest.raises(RuntimeError, match="N50_E020.tif, N50_E030.tif"):
+        _pair_tiles(
+            [tiles / "treecover2000" / "N50_E020.tif", tiles / "treecover2000" / "N50_E030.tif"],
+            [tiles / "lossyear" / "N60_E020.tif", tiles / "lossyear" / "N60_E030.tif"],
+        )
+
+
+def test_as_uint8_if_lossless_narrows_only_fitting_integers() -> None:
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import _as_uint8_if_lossless
+
+    native = np.array([[0, 21]], dtype=np.uint8)
+    assert _as_uint8_if_lossless(native) is native
+
+    narrowed = _as_uint8_if_lossless(np.array([[0, 255]], dtype=np.int32))
+    assert narrowed.dtype == np.uint8
+    assert narrowed.tolist() == [[0, 255]]
+
+    assert _as_uint8_if_lossless(np.array([[0, 2021]], dtype=np.int32)).dtype == np.int32
+    assert _as_uint8_if_lossless(np.array([[-1, 5]], dtype=np.int16)).dtype == np.int16
+    assert _as_uint8_if_lossless(np.array([[0.5]], dtype=np.float32)).dtype == np.float32
+
+
+def test_zone_row_tallies_match_numpy_masks(monkeypatch) -> None:
+    from eudr_dmi_gil.tasks import forest_loss_post_2020_clean as clean
+
+    rng = np.random.default_rng(7)
+    tree = rng.integers(0, 101, (40, 30), dtype=np.uint8)
+    loss = rng.integers(0, 25, (40, 30), dtype=np.uint8)
+    tree_nodata = rng.random((40, 30)) < 0.05
+    loss_nodata = rng.random((40, 30)) < 0.05
+    zone = rng.random((40, 30)) < 0.8
+    kwargs = {"canopy_threshold": 30, "cutoff_code": 20, "end_code": 23}
+
+    tallies = clean._zone_row_tallies(tree, loss, tree_nodata, loss_nodata, zone, **kwargs)
+    monkeypatch.setattr(clean, "_NUMBA_AVAILABLE", False)
+    expected = clean._zone_row_tallies(tree, loss, tree_nodata, loss_nodata, zone, **kwargs)
+
+    assert tallies.shape == (40, clean._TALLY_COUNT)
+    assert np.array_equal(tallies, expected)
+    baseline = (tree >= 30) & ~tree_nodata & ~loss_nodata & zone
+    assert int(tallies[:, clean._TALLY_RFM].sum()) == int(np.count_nonzero(baseline))
+    assert int(tallies[:, clean._TALLY_LOSS_POST_2020].sum()) == int(
+        np.count_nonzero(baseline & (loss > 20))
+    )
+
+
+def test_optional_loss_band_is_read_over_the_aoi_window(tmp_path: Path, caplog) -> None:
+    tile_dir = tmp_path / "tiles"
+    transform = from_bounds(24.0, 59.0, 24.04, 59.04, 4, 4)
+    _write_test_raster(
+        tile_dir / "treecover2000.tif", np.full((4, 4), 50, dtype=np.uint8), transform, "EPSG:4326"
+    )
+    lossyear = np.zeros((4, 4), dtype=np.uint8)
+    lossyear[0, 0] = 21
+    loss = np.zeros((4, 4), dtype=np.uint8)
+    loss_path = tile_dir / "lossyear.tif"
+    with rasterio.open(
+        loss_path,
+        "w",
+        driver="GTiff",
+        height=4,
+        width=4,
+        count=2,
+        dtype="uint8",
+        crs="EPSG:4326",
+        transform=transform,
+    ) as dst:
+        dst.write(lossyear, 1)
+        dst.write(loss, 2)
+        dst.set_band_description(2, "loss")
+
+    # AOI covers only the top-left 2x2 pixels of the 4x4 tile.
+    ring = [[24.0, 59.02], [24.02, 59.02], [24.02, 59.04], [24.0, 59.04], [24.0, 59.02]]
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi_path.write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "properties": {},
+                        "geometry": {"type": "Polygon", "coordinates": [ring]},
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    with caplog.at_level("WARNING"):
+        compute_forest_loss_post_2020(
+            aoi_geojson_path=aoi_path,
+            output_dir=tmp_path / "out",
+            config=HansenConfig(tile_dir=tile_dir, reproject_to_projected=False),
+        )
+    assert "lossyear>0 & loss==0: 1" in caplog.text
+
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import _loss_band_index
+
+    with rasterio.open(loss_path) as ds:
+        assert _loss_band_index(ds) == 2
+    with rasterio.open(tile_dir / "treecover2000.tif") as ds:
+        assert _loss_band_index(ds) is None
+
+
+def test_zone_misses_grid_only_for_strictly_disjoint_bounds() -> None:
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import _zone_misses_grid
+
+    transform = from_bounds(24.0, 59.0, 24.04, 59.04, 4, 4)
+
+    def box(minx: float, miny: float, maxx: float, maxy: float) -> dict:
+        ring = [[minx, miny], [maxx, miny], [maxx, maxy], [minx, maxy], [minx, miny]]
+        return {"type": "Polygon", "coordinates": [ring]}
+
+    assert _zone_misses_grid(box(25.0, 59.0, 25.1, 59.1), transform, (4, 4))
+    assert _zone_misses_grid(box(24.0, 58.0, 24.04, 58.5), transform, (4, 4))
+    assert not _zone_misses_grid(box(24.01, 59.01, 24.02, 59.02), transform, (4, 4))
+    # Touching the tile edge still rasterizes (all_touched may burn edge pixels).
+    assert not _zone_misses_grid(box(24.04, 59.0, 24.1, 59.04), transform, (4, 4))
+
+
+def test_known_tile_ids_select_pairs_from_shared_cache(tmp_path: Path) -> None:
+    tile_dir = tmp_path / "tiles"
+    tiles = {"N60_E020": (20.0, 50.0, 30.0, 60.0), "N10_E100": (100.0, 0.0, 110.0, 10.0)}
+    for tile_id, bounds in tiles.items():
+        transform = from_bounds(*bounds, 2, 2)
+        _write_test_raster(
+            tile_dir / tile_id / "treecover2000.tif",
+            np.full((2, 2), 50, dtype=np.uint8),
+            transform,
+            "EPSG:4326",
+        )
+        _write_test_raster(
+            tile_dir / tile_id / "lossyear.tif",
+            np.zeros((2, 2), dtype=np.uint8),
+            transform,
+            "EPSG:4326",
+        )
+
+    ring = [[21.0, 51.0], [22.0, 51.0], [22.0, 52.0], [21.0, 52.0], [21.0, 51.0]]
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi_path.write_text(json.dumps({"type": "Polygon", "coordinates": [ring]}), encoding="utf-8")
+
+    result = compute_forest_loss_post_2020(
+        aoi_geojson_path=aoi_path,
+        output_dir=tmp_path / "out",
+        config=HansenConfig(
+            tile_dir=tile_dir, tile_ids=["N60_E020"], reproject_to_projected=False
+        ),
+    )
+    assert sorted(p.relpath for p in result.tile_provenance) == [
+        "N60_E020/lossyear.tif",
+        "N60_E020/treecover2000.tif",
+    ]
+
+
+_SINGLE_THEN_MULTI_PAIR_SCRIPT = """
+import sys
+from pathlib import Path
+
+from eudr_dmi_gil.tasks.forest_loss_post_2020 import HansenConfig, compute_forest_loss_post_2020
+
+root = Path(sys.argv[1])
+for name in ("single", "multi"):
+    compute_forest_loss_post_2020(
+        aoi_geojson_path=root / "aoi.geojson",
+        output_dir=root / "out" / name,
+        config=HansenConfig(tile_dir=root / name, reproject_to_projected=False),
+    )
+"""
+
+
+def test_single_then_multi_pair_runs_exit_cleanly(tmp_path: Path) -> None:
+    # A multi-pair run after a single-pair run in the same process once hung the
+    # interpreter at exit (worker processes forked after numba started its threads).
+    tiles = {"N60_E020": (20.0, 50.0, 30.0, 60.0), "N60_E030": (30.0, 50.0, 40.0, 60.0)}
+    for tile_id, bounds in tiles.items():
+        transform = from_bounds(*bounds, 2, 2)
+        for tile_dir in (tmp_path / "multi", tmp_path / "single"):
+            if tile_dir.name == "single" and tile_id != "N60_E020":
+                continue
+            _write_test_raster(
+                tile_dir / tile_id / "treecover2000.tif",
+                np.full((2, 2), 50, dtype=np.uint8),
+                transform,
+                "EPSG:4326",
+            )
+            _write_test_raster(
+                tile_dir / tile_id / "lossyear.tif",
+                np.array([[0, 21], [0, 0]], dtype=np.uint8),
+                transform,
+                "EPSG:4326",
+            )
+
+    ring = [[20.0, 50.0], [40.0, 50.0], [40.0, 60.0], [20.0, 60.0], [20.0, 50.0]]
+    (tmp_path / "aoi.geojson").write_text(
+        json.dumps({"type": "Polygon", "coordinates": [ring]}), encoding="utf-8"
+    )
+
+    env = dict(os.environ)
+    src_path = str(Path(__file__).resolve().parents[1] / "src")
+    env["PYTHONPATH"] = src_path + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+    proc = subprocess.run(
+        [sys.executable, "-c", _SINGLE_THEN_MULTI_PAIR_SCRIPT, str(tmp_path)],
+        check=False,
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert (tmp_path / "out" / "multi").is_dir()
+
+
+def test_load_aoi_geometry_coverage_hint_matches_unary_union(tmp_path: Path) -> None:
+    from shapely.geometry import shape
+
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import _load_aoi_geometry
+
+    def square(x: float, y: float, size: float = 1.0) -> dict:
+        ring = [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+        geometry = {"type": "Polygon", "coordinates": [ring]}
+        return {"type": "Feature", "properties": {}, "geometry": geometry}
+
+    for features in ([square(0, 0), square(1, 0)], [square(0, 0), square(0.5, 0)]):
+        areas = []
+        for coverage in (False, True):
+            path = tmp_path / f"aoi_{coverage}.geojson"
+            payload = {"type": "FeatureCollection", "coverage": coverage, "features": features}
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            areas.append(shape(_load_aoi_geometry(path)).area)
+        assert areas[0] == pytest.approx(areas[1])
+
+
+def test_encoded_mask_features_write_same_bytes_as_feature_collection(tmp_path: Path) -> None:
+    from eudr_dmi_gil.reports.determinism import write_json
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import (
+        _encode_mask_features,
+        _write_mask_geojson,
+    )
+
+    def point(x: float, label: str) -> dict:
+        geometry = {"type": "Point", "coordinates": [x, 0.0]}
+        return {"type": "Feature", "properties": {"label": label}, "geometry": geometry}
+
+    features = [point(2.0, "b"), point(1.0, "ä"), point(2.0, "a")]
+    _write_mask_geojson(tmp_path / "encoded.geojson", _encode_mask_features(features))
+
+    ordered = sorted(features, key=lambda f: json.dumps(f["geometry"], sort_keys=True))
+    write_json(tmp_path / "dicts.geojson", {"type": "FeatureCollection", "features": ordered})
+    assert (tmp_path / "encoded.geojson").read_bytes() == (tmp_path / "dicts.geojson").read_bytes()
+
+    _write_mask_geojson(tmp_path / "empty.geojson", [])
+    assert json.loads((tmp_path / "empty.geojson").read_text(encoding="utf-8")) == {
+        "type": "FeatureCollection",
+        "features": [],
+    }
+
+
+def test_geom_in_crs_skips_identity_transform() -> None:
+    from rasterio.crs import CRS
+
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import _geom_in_crs
+
+    geom = {"type": "Point", "coordinates": [24.0, 59.0]}
+    assert _geom_in_crs(geom, CRS.from_epsg(4326)) is geom
+    projected = _geom_in_crs(geom, CRS.from_epsg(6933))
+    assert projected["coordinates"] != geom["coordinates"]
+
+
+def test_read_aoi_band_plain_read_matches_masked_read(tmp_path: Path) -> None:
+    from rasterio.windows import Window
+
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import _read_aoi_band
+
+    data = np.random.default_rng(2).integers(0, 256, (6, 6), dtype=np.uint8)
+    path = tmp_path / "nodata.tif"
+    transform = from_bounds(24.0, 59.0, 24.06, 59.06, 6, 6)
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        height=6,
+        width=6,
+        count=1,
+        dtype="uint8",
+        crs="EPSG:4326",
+        transform=transform,
+        nodata=255,
+    ) as dst:
+        dst.write(data, 1)
+
+    window = Window(1, 1, 4, 4)
+    outside = np.zeros((4, 4), dtype=bool)
+    outside[0, :] = True
+    with rasterio.open(path) as ds:
+        values, invalid = _read_aoi_band(ds, window, outside)
+        masked = ds.read(1, window=window, masked=True)
+
+    expected_invalid = np.ma.getmaskarray(masked) | outside
+    assert np.array_equal(invalid, expected_invalid)
+    assert np.array_equal(values, np.where(expected_invalid, 0, np.ma.getdata(masked)))
+
+
+def test_layer_subdirectory_lookup_does_not_walk_the_whole_cache(tmp_path: Path) -> None:
+    from eudr_dmi_gil.tasks.forest_loss_post_2020_clean import LocalTileSource
+
+    (tmp_path / "treecover2000").mkdir()
+    (tmp_path / "treecover2000" / "b.tif").write_bytes(b"")
+    (tmp_path / "treecover2000" / "a.tif").write_bytes(b"")
+    (tmp_path / "N60_E020").mkdir()
+    (tmp_path / "N60_E020" / "lossyear.tif").write_bytes(b"")
+
+    source = LocalTileSource(tmp_path)
+    assert source.list_layer_files("treecover2000") == [
+        tmp_path / "treecover2000" / "a.tif",
+        tmp_path / "treecover2000" / "b.tif",
+    ]
+    assert source._tifs is None
+
+    assert source.list_layer_files("lossyear") == [tmp_path / "N60_E020" / "lossyear.tif"]
+    assert source._tifs is not None
+
+
+def test_fallback_reprojection_uses_zone_in_landed_crs(tmp_path: Path, monkeypatch) -> None:
+    import eudr_dmi_gil.tasks.forest_loss_post_2020_clean as clean
+
+    tile_dir = tmp_path / "tiles"
+    bounds = (24.0, 59.0, 24.02, 59.02)
+    transform = from_bounds(*bounds, 4, 4)
+    treecover = np.full((4, 4), 80, dtype=np.uint8)
+    lossyear = np.zeros((4, 4), dtype=np.uint8)
+    lossyear[:2, :2] = 22
+    _write_test_raster(tile_dir / "treecover2000.tif", treecover, transform, "EPSG:4326")
+    _write_test_raster(tile_dir / "lossyear.tif", lossyear, transform, "EPSG:4326")
+
+    aoi_path = tmp_path / "aoi.geojson"
+    aoi_path.write_text(
+        json.dumps(
+            {
+                "type": "Feature",
+                "properties": {},
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [
+                            [bounds[0], bounds[1]],
+                            [bounds[2], bounds[1]],
+                            [bounds[2], bounds[3]],
+                            [bounds[0], bounds[3]],
+                            [bounds[0], bounds[1]],
+                        ]
+                    ],
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    def run(name: str, projected_crs: str):
+        return compute_forest_loss_post_2020(
+            aoi_geojson_path=aoi_path,
+            output_dir=tmp_path / name,
+            config=HansenConfig(
+                tile_dir=tile_dir,
+                cutoff_year=2020,
+                write_masks=False,
+                reproject_to_projected=True,
+                projected_crs=projected_crs,
+            ),
+        )
+
+    expected = run("direct", "EPSG:3857")
+
+    # Simulate the target CRS failing so the tile falls back to EPSG:3857.
+    reproject = clean._reproject_to_projected
+
+    def fallback_reproject(**kwargs):
+        return reproject(**{**kwargs, "target_crs": "EPSG:3857"})
+
+    monkeypatch.setattr(clean, "_reproject_to_projected", fallback_reproject)
+    result = run("fallback", "EPSG:6933")
+
+    assert expected.forest_loss_post_2020_ha > 0
+    assert result.forest_loss_post_2020_ha == expected.forest_loss_post_2020_ha
+    assert result.initial_tree_cover_ha == expected.initial_tree_cover_ha
+    assert result.current_tree_cover_ha == expected.current_tree_cover_ha
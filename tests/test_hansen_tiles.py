@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
-from eudr_dmi_gil.deps.hansen_acquire import infer_hansen_latest_year
+from eudr_dmi_gil.deps.hansen_acquire import (
+    infer_hansen_latest_year,
+    sha256_tile_cached,
+    tile_hash_cache_path,
+)
 from eudr_dmi_gil.deps.hansen_tiles import hansen_tile_ids_for_bbox, load_aoi_bbox
+from eudr_dmi_gil.reports.determinism import sha256_file
 
 
 def test_hansen_tile_ids_for_estonia_fixture() -> None:
@@ -22,6 +28,29 @@ def test_hansen_tile_ids_for_multipolygon_fixture() -> None:
     assert tile_ids == ["N60_E020", "N60_E030", "N70_E020", "N70_E030"]
 
 
+def test_load_aoi_bbox_reparses_only_when_the_file_changes(tmp_path: Path) -> None:
+    import os
+
+    from eudr_dmi_gil.deps.hansen_tiles import _load_aoi_bbox_cached
+
+    aoi_path = tmp_path / "aoi.geojson"
+
+    def write_aoi(lon: float) -> None:
+        ring = [[lon, 50.5], [lon + 1, 50.5], [lon + 1, 51.5], [lon, 51.5], [lon, 50.5]]
+        aoi_path.write_text(json.dumps({"type": "Polygon", "coordinates": [ring]}), encoding="utf-8")
+
+    write_aoi(25.0)
+    assert load_aoi_bbox(aoi_path) == (25.0, 50.5, 26.0, 51.5)
+    hits = _load_aoi_bbox_cached.cache_info().hits
+    assert load_aoi_bbox(aoi_path) == (25.0, 50.5, 26.0, 51.5)
+    assert _load_aoi_bbox_cached.cache_info().hits == hits + 1
+
+    mtime_ns = aoi_path.stat().st_mtime_ns
+    write_aoi(35.0)
+    os.utime(aoi_path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert load_aoi_bbox(aoi_path) == (35.0, 50.5, 36.0, 51.5)
+
+
 def test_infer_hansen_latest_year_from_dataset_version(tmp_path: Path) -> None:
     external_root = tmp_path / "external"
     (external_root / "hansen" / "hansen_gfc_2026_v1_12").mkdir(parents=True)
@@ -45,3 +74,18 @@ def test_infer_hansen_latest_year_from_external_root(tmp_path: Path) -> None:
         external_root=tmp_path,
     )
     assert year == 2023
+
+
+def test_sha256_tile_cached_persists_and_tracks_rewrites(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("EUDR_DMI_DATA_ROOT", str(tmp_path / "data"))
+    tile = tmp_path / "tiles" / "N50_E020" / "lossyear.tif"
+    tile.parent.mkdir(parents=True)
+    tile.write_bytes(b"tile-v1")
+
+    first = sha256_tile_cached(tile)
+    assert first == sha256_file(tile)
+    cache = json.loads(tile_hash_cache_path().read_text(encoding="utf-8"))
+    assert cache[str(tile.resolve())]["sha256"] == first
+
+    tile.write_bytes(b"tile-v2-longer")
+    assert sha256_tile_cached(tile) == sha256_file(tile) != first
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 from typing import Any
@@ -28,8 +29,8 @@ def _write_geojson(path: Path, data: dict[str, Any]) -> None:
     path.write_text(json.dumps(data), encoding="utf-8")
 
 
-def _write_simple_aoi(path: Path) -> None:
-    aoi = {
+_SIMPLE_AOI_BYTES = json.dumps(
+    {
         "type": "FeatureCollection",
         "features": [
             {
@@ -50,7 +51,25 @@ def _write_simple_aoi(path: Path) -> None:
             }
         ],
     }
-    _write_geojson(path, aoi)
+).encode("utf-8")
+
+
+def _write_simple_aoi(path: Path) -> None:
+    path.write_bytes(_SIMPLE_AOI_BYTES)
+
+
+_PARCEL_GEOMETRY: dict[str, Any] = {
+    "type": "Polygon",
+    "coordinates": [
+        [
+            [0.1, 0.1],
+            [0.2, 0.1],
+            [0.2, 0.2],
+            [0.1, 0.2],
+            [0.1, 0.1],
+        ]
+    ],
+}
 
 
 def _parcel_feature(parcel_id: str, *, mets: float | None, pindala: float | None) -> dict[str, Any]:
@@ -64,22 +83,8 @@ def _parcel_feature(parcel_id: str, *, mets: float | None, pindala: float | None
     }
     if mets is not None:
         props["mets"] = mets
-    return {
-        "type": "Feature",
-        "properties": props,
-        "geometry": {
-            "type": "Polygon",
-            "coordinates": [
-                [
-                    [0.1, 0.1],
-                    [0.2, 0.1],
-                    [0.2, 0.2],
-                    [0.1, 0.2],
-                    [0.1, 0.1],
-                ]
-            ],
-        },
-    }
+    # Features are only serialized, never mutated in place, so they share one geometry.
+    return {"type": "Feature", "properties": props, "geometry": _PARCEL_GEOMETRY}
 
 
 def test_crosscheck_not_comparable(tmp_path: Path) -> None:
@@ -178,28 +183,16 @@ def test_maaamet_top10_selection_wfs(monkeypatch: pytest.MonkeyPatch, tmp_path:
     aoi_path = tmp_path / "aoi.geojson"
     _write_simple_aoi(aoi_path)
 
-    features = []
-    for idx in range(12):
-        mets = (idx + 1) * 1000
-        features.append(_parcel_feature(f"p{idx+1}", mets=mets, pindala=100000 + idx))
+    features = [
+        _parcel_feature(f"p{idx + 1}", mets=(idx + 1) * 1000, pindala=100000 + idx)
+        for idx in range(12)
+    ]
     payload = json.dumps({"type": "FeatureCollection", "features": features}).encode("utf-8")
 
-    class _Resp:
-        def __init__(self, data: bytes) -> None:
-            self._data = data
-
-        def read(self) -> bytes:
-            return self._data
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb) -> None:
-            return None
-
+    # A file-like body, as urlopen returns: the provider reads it through json.load.
     monkeypatch.setattr(
         "eudr_dmi_gil.analysis.maaamet_validation.urllib.request.urlopen",
-        lambda url: _Resp(payload),
+        lambda url: io.BytesIO(payload),
     )
 
     provider = WfsMaaAmetProvider("https://gsavalik.envir.ee/geoserver/wfs", "kataster:ky_kehtiv")
@@ -5,11 +5,13 @@ import subprocess
 import sys
 from pathlib import Path
 
-from eudr_dmi.reports.build_report import build_report_v1
+import pytest
 
+from eudr_dmi.reports.build_report import build_report_v1
+from scripts import generate_report_v1
 
-def _write_demo_geojson(path: Path) -> None:
-    payload = {
+_DEMO_GEOJSON_BYTES = json.dumps(
+    {
         "type": "FeatureCollection",
         "features": [
             {
@@ -38,7 +40,11 @@ def _write_demo_geojson(path: Path) -> None:
             },
         ],
     }
-    path.write_text(json.dumps(payload), encoding="utf-8")
+).encode("utf-8")
+
+
+def _write_demo_geojson(path: Path) -> None:
+    path.write_bytes(_DEMO_GEOJSON_BYTES)
 
 
 def test_missing_kyc_coerces_to_na(tmp_path: Path) -> None:
@@ -60,7 +66,16 @@ def test_missing_kyc_coerces_to_na(tmp_path: Path) -> None:
     assert payload["commodity"]["country_of_production"] == "N/A"
 
 
-def test_generated_out_structure_exists(tmp_path: Path) -> None:
+@pytest.fixture(scope="session")
+def generated_report_bundle(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Run the report CLI once on the demo AOI and return the plot output directory.
+
+    `build_report_v1` is deterministic, so tests that only inspect the default
+    bundle share this single invocation. It runs as a subprocess so the script's
+    `__main__` entry point stays covered; other tests call `main()` in-process.
+    """
+
+    tmp_path = tmp_path_factory.mktemp("bundle")
     geojson_path = tmp_path / "demo.geojson"
     _write_demo_geojson(geojson_path)
 
@@ -80,41 +95,19 @@ def test_generated_out_structure_exists(tmp_path: Path) -> None:
     proc = subprocess.run(cmd, text=True, capture_output=True, check=False)
     assert proc.returncode == 0, proc.stderr
 
-    out = tmp_path / "out" / "reports" / "demo_2026-02-20" / "demo_plot_01"
+    return tmp_path / "out" / "reports" / "demo_2026-02-20" / "demo_plot_01"
+
+
+def test_generated_out_structure_exists(generated_report_bundle: Path) -> None:
+    out = generated_report_bundle
     assert (out / "report.json").is_file()
     assert (out / "report.html").is_file()
     assert (out / "report.pdf").is_file()
     assert (out / "manifest.sha256").is_file()
 
 
-def test_manifest_has_three_entries(tmp_path: Path) -> None:
-    geojson_path = tmp_path / "demo.geojson"
-    _write_demo_geojson(geojson_path)
-
-    repo_root = Path(__file__).resolve().parents[1]
-    cmd = [
-        sys.executable,
-        str(repo_root / "scripts" / "generate_report_v1.py"),
-        "--run-id",
-        "demo_2026-02-20",
-        "--plot-id",
-        "demo_plot_01",
-        "--aoi-geojson",
-        str(geojson_path),
-        "--out-dir",
-        str(tmp_path / "out" / "reports"),
-    ]
-    proc = subprocess.run(cmd, text=True, capture_output=True, check=False)
-    assert proc.returncode == 0, proc.stderr
-
-    manifest = (
-        tmp_path
-        / "out"
-        / "reports"
-        / "demo_2026-02-20"
-        / "demo_plot_01"
-        / "manifest.sha256"
-    )
+def test_manifest_has_three_entries(generated_report_bundle: Path) -> None:
+    manifest = generated_report_bundle / "manifest.sha256"
     lines = [line.strip() for line in manifest.read_text(encoding="utf-8").splitlines() if line.strip()]
 
     assert len(lines) == 3
@@ -195,23 +188,21 @@ def test_generate_report_with_analysis_writes_static_map_svg(tmp_path: Path) ->
     }
     analysis_path.write_text(json.dumps(analysis_payload), encoding="utf-8")
 
-    repo_root = Path(__file__).resolve().parents[1]
-    cmd = [
-        sys.executable,
-        str(repo_root / "scripts" / "generate_report_v1.py"),
-        "--run-id",
-        "demo_2026-02-20",
-        "--plot-id",
-        "demo_plot_01",
-        "--aoi-geojson",
-        str(geojson_path),
-        "--analysis-json",
-        str(analysis_path),
-        "--out-dir",
-        str(tmp_path / "out" / "reports"),
-    ]
-    proc = subprocess.run(cmd, text=True, capture_output=True, check=False)
-    assert proc.returncode == 0, proc.stderr
+    status = generate_report_v1.main(
+        [
+            "--run-id",
+            "demo_2026-02-20",
+            "--plot-id",
+            "demo_plot_01",
+            "--aoi-geojson",
+            str(geojson_path),
+            "--analysis-json",
+            str(analysis_path),
+            "--out-dir",
+            str(tmp_path / "out" / "reports"),
+        ]
+    )
+    assert status == 0
 
     out = tmp_path / "out" / "reports" / "demo_2026-02-20" / "demo_plot_01"
     assert (out / "deforestation_map.svg").is_file()
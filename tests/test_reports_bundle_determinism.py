@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 
 from eudr_dmi_gil.reports.bundle import write_manifest
+from eudr_dmi_gil.reports.determinism import (
+    MMAP_HASH_THRESHOLD_BYTES,
+    create_deterministic_zip,
+    sha256_bytes,
+    sha256_file,
+    sha256_file_cached,
+    sha256_files_cached,
+    write_bytes,
+)
 
 
 def test_manifest_bytes_deterministic_same_inputs(tmp_path: Path) -> None:
@@ -41,3 +52,67 @@ def test_manifest_bytes_stable_ordering(tmp_path: Path) -> None:
 
     # Also ensure the file on disk matches returned bytes.
     assert (bundle_dir / "manifest.json").read_bytes() == m1
+
+
+def test_manifest_relpaths_are_posix(tmp_path: Path) -> None:
+    bundle_dir = tmp_path / "audit" / "evidence" / "2026-01-31" / "bundle-003"
+    nested = bundle_dir / "reports" / "aoi_report_v2" / "aoi-1" / "metrics.csv"
+    nested.parent.mkdir(parents=True, exist_ok=True)
+    nested.write_text("variable,value,unit,source,notes\r\n", encoding="utf-8")
+
+    manifest = json.loads(write_manifest(bundle_dir, [nested]))
+
+    assert [a["relpath"] for a in manifest["artifacts"]] == [
+        "reports/aoi_report_v2/aoi-1/metrics.csv"
+    ]
+
+
+def test_sha256_file_cached_tracks_rewrites(tmp_path: Path) -> None:
+    path = tmp_path / "artifact.json"
+    write_bytes(path, b"{\"x\": 1}\n")
+
+    cache: dict[str, tuple[int, int, str]] = {}
+    first = sha256_file_cached(path, cache)
+    assert first == (sha256_bytes(b"{\"x\": 1}\n"), 9)
+    assert sha256_file_cached(path, cache) == first
+    assert list(cache) == [os.path.abspath(path)]
+
+    write_bytes(path, b"{\"x\": 22}\n")
+    assert sha256_file_cached(path, cache) == (sha256_bytes(b"{\"x\": 22}\n"), 10)
+    assert sha256_file_cached(path) == (sha256_bytes(b"{\"x\": 22}\n"), 10)
+
+
+def test_sha256_files_cached_preserves_input_order(tmp_path: Path) -> None:
+    paths = []
+    for name in ["c.csv", "a.json", "b.geojson"]:
+        path = tmp_path / name
+        write_bytes(path, name.encode("utf-8"))
+        paths.append(path)
+
+    digests = sha256_files_cached(paths)
+
+    assert list(digests) == paths
+    assert digests[paths[1]] == (sha256_bytes(b"a.json"), 6)
+
+
+def test_deterministic_zip_streams_paths_identically(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    contents = {"b/mask.geojson": b"{\"features\": []}\n" * 1000, "a.html": b"<html></html>\n"}
+    for rel, data in contents.items():
+        write_bytes(src / rel, data)
+
+    from_bytes = tmp_path / "from_bytes.zip"
+    from_paths = tmp_path / "from_paths.zip"
+    create_deterministic_zip(from_bytes, contents)
+    create_deterministic_zip(from_paths, {rel: src / rel for rel in contents})
+
+    assert from_bytes.read_bytes() == from_paths.read_bytes()
+
+
+def test_sha256_file_large_files_use_same_digest(tmp_path: Path) -> None:
+    data = bytes(range(256)) * ((MMAP_HASH_THRESHOLD_BYTES // 256) + 1)
+    path = tmp_path / "tile.tif"
+    write_bytes(path, data)
+
+    assert sha256_file(path) == sha256_bytes(data)
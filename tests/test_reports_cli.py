@@ -12,6 +12,8 @@ import numpy as np
 import rasterio
 from rasterio.transform import from_bounds
 
+from eudr_dmi_gil.reports import cli
+from eudr_dmi_gil.reports.determinism import canonical_json_bytes
 from eudr_dmi_gil.reports.validate import validate_aoi_report_file
 
 
@@ -45,15 +47,15 @@ def _write_test_raster(path: Path, data: np.ndarray, transform, crs: str) -> Non
 
 
 def test_cli_help() -> None:
+    # Shells out so the `python -m` entry point stays covered; other tests call main().
     proc = _run_cli(["--help"], env=os.environ.copy())
     assert proc.returncode == 0
     assert "Generate a deterministic AOI report bundle" in proc.stdout
 
 
-def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
+def test_cli_golden_run_creates_bundle(tmp_path: Path, monkeypatch) -> None:
     evidence_root = tmp_path / "evidence"
-    env = os.environ.copy()
-    env["EUDR_DMI_EVIDENCE_ROOT"] = str(evidence_root)
+    monkeypatch.setenv("EUDR_DMI_EVIDENCE_ROOT", str(evidence_root))
 
     bundle_id = "bundle-001"
     aoi_id = "aoi-123"
@@ -64,7 +66,7 @@ def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
         encoding="utf-8",
     )
 
-    proc = _run_cli(
+    status = cli.main(
         [
             "--aoi-id",
             aoi_id,
@@ -82,11 +84,10 @@ def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
             "policy-spine:eudr/article-9",
             "--policy-mapping-ref-file",
             str(policy_ref_file),
-        ],
-        env=env,
+        ]
     )
 
-    assert proc.returncode == 0, proc.stderr
+    assert status == 0
 
     bundle_date = datetime.now(timezone.utc).date().strftime("%Y-%m-%d")
     bundle_dir = evidence_root / bundle_date / bundle_id
@@ -110,6 +111,7 @@ def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
 
     # report.html should link to declared HTML artifacts if present.
     report_obj = json.loads(report_json.read_text(encoding="utf-8"))
+    assert report_json.read_bytes() == canonical_json_bytes(report_obj) + b"\n"
     html_relpaths = [
         item.get("relpath")
         for item in report_obj.get("evidence_artifacts", [])
@@ -147,10 +149,9 @@ def test_cli_golden_run_creates_bundle(tmp_path: Path) -> None:
     assert f"reports/aoi_report_v2/{aoi_id}/metrics.csv" in relpaths
 
 
-def test_cli_hansen_external_dependencies(tmp_path: Path) -> None:
+def test_cli_hansen_external_dependencies(tmp_path: Path, monkeypatch) -> None:
     evidence_root = tmp_path / "evidence"
-    env = os.environ.copy()
-    env["EUDR_DMI_EVIDENCE_ROOT"] = str(evidence_root)
+    monkeypatch.setenv("EUDR_DMI_EVIDENCE_ROOT", str(evidence_root))
 
     bundle_id = "bundle-hansen-001"
     aoi_id = "aoi-456"
@@ -191,7 +192,7 @@ def test_cli_hansen_external_dependencies(tmp_path: Path) -> None:
         _write_test_raster(tile_dir / tile_id / "treecover2000.tif", treecover, transform, "EPSG:4326")
         _write_test_raster(tile_dir / tile_id / "lossyear.tif", lossyear, transform, "EPSG:4326")
 
-    proc = _run_cli(
+    status = cli.main(
         [
             "--aoi-id",
             aoi_id,
@@ -204,16 +205,16 @@ def test_cli_hansen_external_dependencies(tmp_path: Path) -> None:
             "--enable-hansen-post-2020-loss",
             "--hansen-tile-dir",
             str(tile_dir),
-        ],
-        env=env,
+        ]
     )
 
-    assert proc.returncode == 0, proc.stderr
+    assert status == 0
 
     bundle_date = datetime.now(timezone.utc).date().strftime("%Y-%m-%d")
     bundle_dir = evidence_root / bundle_date / bundle_id
     report_json = bundle_dir / "reports" / "aoi_report_v2" / f"{aoi_id}.json"
     report = json.loads(report_json.read_text(encoding="utf-8"))
+    assert report_json.read_bytes() == canonical_json_bytes(report) + b"\n"
 
     deps = report.get("external_dependencies")
     assert isinstance(deps, list) and deps
@@ -256,3 +257,32 @@ def test_cli_hansen_external_dependencies(tmp_path: Path) -> None:
     map_config_rel = map_assets.get("config_relpath")
     assert isinstance(map_config_rel, str)
     assert (bundle_dir / map_config_rel).is_file()
+
+
+def test_cli_rerun_reproduces_bundle_and_repairs_damaged_report(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    evidence_root = tmp_path / "evidence"
+    monkeypatch.setenv("EUDR_DMI_EVIDENCE_ROOT", str(evidence_root))
+    monkeypatch.setenv("EUDR_DMI_GIT_COMMIT", "test")
+    monkeypatch.setattr(cli, "_utc_now_iso", lambda: "2026-01-31T00:00:00+00:00")
+
+    args = ["--aoi-id", "aoi-789", "--aoi-wkt", "POINT (0 0)", "--bundle-id", "bundle-rerun"]
+    assert cli.main(args) == 0
+    bundle_dir = Path(capsys.readouterr().out.strip().splitlines()[-1])
+    report_json = bundle_dir / "reports" / "aoi_report_v2" / "aoi-789.json"
+    report_bytes = report_json.read_bytes()
+    manifest_bytes = (bundle_dir / "manifest.json").read_bytes()
+
+    assert cli.main(args) == 0
+    out_lines = capsys.readouterr().out.strip().splitlines()
+    assert [line for line in out_lines if not line.startswith("[profile]")] == [str(bundle_dir)]
+    assert report_json.read_bytes() == report_bytes
+    assert (bundle_dir / "manifest.json").read_bytes() == manifest_bytes
+
+    # Damaged evidence is never trusted: the rerun rewrites it from the computed bytes.
+    report_json.write_bytes(report_bytes[: len(report_bytes) // 2])
+    assert cli.main(args) == 0
+    assert report_json.read_bytes() == report_bytes
+    assert (bundle_dir / "manifest.json").read_bytes() == manifest_bytes
+    assert not [p for p in bundle_dir.rglob(".*")]
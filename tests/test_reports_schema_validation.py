@@ -461,6 +461,16 @@ def test_schema_rejects_orphaned_results_without_traceability() -> None:
         validate_aoi_report(bad)
 
 
+def test_traceability_reports_non_string_result_ids_as_orphaned() -> None:
+    from eudr_dmi_gil.reports.validate import _validate_traceability
+
+    report = _golden_aoi_report_v2()
+    report["results"] = [{"result_id": 7, "criteria_ids": ["aoi_geometry_present"]}]
+    report["regulatory_traceability"] = []
+    with pytest.raises(ValidationError, match=r"Orphaned results without traceability: \[7\]"):
+        _validate_traceability(report)
+
+
 def test_schema_rejects_traceability_unknown_references() -> None:
     bad = _golden_aoi_report_v2()
     bad["results"] = [{"result_id": "result-004", "criteria_ids": ["aoi_geometry_present"]}]